@@ -24,6 +24,8 @@ Environment Variables:
   PCP_PASSWORD      HTTP basic auth password (optional)
   PCP_ALLOWED_HOSTS Comma-separated hostspecs allowed via host parameter (optional)
                     If not set, only target_host is allowed. Use '*' for any host.
+  PCP_SNAPSHOT_TTL  Seconds to reuse identical system snapshots and process
+                    listings (default: 2, 0 disables, max: 60)
 
 Examples:
   # Monitor localhost (default)
@@ -13,8 +13,10 @@ else:
 
 import httpx
 
+from pcp_mcp.utils.extractors import extract_timestamp
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Callable, Collection, Coroutine, Sequence
     from typing import Any
 
     ProgressCallback = Callable[[float, float, str], Coroutine[Any, Any, None]]
@@ -127,11 +129,11 @@ class PCPClient:
 
         return resp
 
-    async def fetch(self, metric_names: list[str]) -> dict:
+    async def fetch(self, metric_names: Sequence[str]) -> dict:
         """Fetch current values for metrics.
 
         Args:
-            metric_names: List of PCP metric names to fetch.
+            metric_names: PCP metric names to fetch.
 
         Returns:
             Raw JSON response from pmproxy /pmapi/fetch endpoint.
@@ -193,8 +195,8 @@ class PCPClient:
 
     async def fetch_with_rates(
         self,
-        metric_names: list[str],
-        counter_metrics: set[str],
+        metric_names: Sequence[str],
+        counter_metrics: Collection[str],
         sample_interval: float = 1.0,
         progress_callback: ProgressCallback | None = None,
     ) -> dict[str, dict]:
@@ -205,8 +207,8 @@ class PCPClient:
         Gauge metrics return the second sample's value.
 
         Args:
-            metric_names: List of PCP metric names to fetch.
-            counter_metrics: Set of metric names that are counters.
+            metric_names: PCP metric names to fetch.
+            counter_metrics: Metric names that are counters.
             sample_interval: Seconds between samples for rate calculation.
             progress_callback: Optional async callback for progress updates.
                 Called with (current, total, message) during long operations.
@@ -233,12 +235,8 @@ class PCPClient:
         if progress_callback:
             await progress_callback(90, 100, "Computing rates...")
 
-        ts1 = t1.get("timestamp", 0.0)
-        ts2 = t2.get("timestamp", 0.0)
-        if isinstance(ts1, dict):
-            ts1 = ts1.get("s", 0) + ts1.get("us", 0) / 1e6
-        if isinstance(ts2, dict):
-            ts2 = ts2.get("s", 0) + ts2.get("us", 0) / 1e6
+        ts1 = extract_timestamp(t1)
+        ts2 = extract_timestamp(t2)
         elapsed = ts2 - ts1 if ts2 > ts1 else sample_interval
 
         results: dict[str, dict] = {}
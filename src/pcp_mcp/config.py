@@ -5,6 +5,9 @@ from __future__ import annotations
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Upper bound for snapshot_ttl; the snapshot caches retain entries this long.
+MAX_SNAPSHOT_TTL = 60.0
+
 
 class PCPMCPSettings(BaseSettings):
     """Configuration for the PCP MCP server.
@@ -17,6 +20,8 @@ class PCPMCPSettings(BaseSettings):
         target_host: Target pmcd host to monitor (can be remote hostname).
         username: HTTP basic auth user.
         password: HTTP basic auth password.
+        snapshot_ttl: Seconds to reuse a system snapshot or process listing for
+            identical requests, at most MAX_SNAPSHOT_TTL.
     """
 
     model_config = SettingsConfigDict(
@@ -43,6 +48,15 @@ class PCPMCPSettings(BaseSettings):
     )
     username: str | None = Field(default=None, description="HTTP basic auth user")
     password: str | None = Field(default=None, description="HTTP basic auth password")
+    snapshot_ttl: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=MAX_SNAPSHOT_TTL,
+        description=(
+            "Seconds to reuse a system snapshot or process listing for identical requests"
+            " (0 disables, at most 60)"
+        ),
+    )
     allowed_hosts: list[str] | None = Field(
         default=None,
         description=(
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from fastmcp import Context
@@ -15,6 +18,118 @@ if TYPE_CHECKING:
     from pcp_mcp.config import PCPMCPSettings
 
 
+DEFAULT_IDLE_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass
+class _PooledClient:
+    client: PCPClient
+    in_use: int = 0
+    last_used: float = 0.0
+
+
+class HostClientPool:
+    """Keep ad-hoc PCPClient connections open for reuse across tool calls.
+
+    Clients for hosts other than the configured target are created on first
+    use and shared by later calls. A client that nothing is using and that has
+    been idle for longer than idle_timeout is closed on the next acquire();
+    any still open are closed by aclose().
+    """
+
+    def __init__(
+        self, settings: PCPMCPSettings, idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            settings: Settings used to connect new clients.
+            idle_timeout: Seconds an unused client is kept before the next
+                acquire() closes it.
+        """
+        self._settings = settings
+        self._idle_timeout = idle_timeout
+        self._clients: dict[str, _PooledClient] = {}
+        # One shared connect per host, so a slow host never blocks other hosts.
+        # Pool bookkeeping never awaits, so it needs no lock on the event loop.
+        self._connecting: dict[str, asyncio.Task[_PooledClient]] = {}
+
+    @asynccontextmanager
+    async def acquire(self, host: str) -> AsyncIterator[PCPClient]:
+        """Borrow a connected client for a host, connecting it if needed.
+
+        Args:
+            host: Target pmcd hostspec.
+
+        Yields:
+            PCPClient connected to the host.
+        """
+        await self._close_clients(self._take_idle())
+
+        entry = self._clients.get(host)
+        if entry is None:
+            task = self._connecting.get(host)
+            if task is None:
+                task = self._connecting[host] = asyncio.ensure_future(self._connect(host))
+            # Shield so one caller being cancelled doesn't abort the shared connect.
+            entry = await asyncio.shield(task)
+        entry.in_use += 1
+
+        try:
+            yield entry.client
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    async def _connect(self, host: str) -> _PooledClient:
+        """Connect a new client for host and add it to the pool."""
+        try:
+            client = PCPClient(
+                base_url=self._settings.base_url,
+                target_host=host,
+                auth=self._settings.auth,
+                timeout=self._settings.timeout,
+                verify=self._settings.verify,
+            )
+            try:
+                await client.__aenter__()
+            except BaseException:
+                await client.__aexit__(None, None, None)
+                raise
+            entry = self._clients[host] = _PooledClient(client, last_used=time.monotonic())
+            return entry
+        finally:
+            if self._connecting.get(host) is asyncio.current_task():
+                del self._connecting[host]
+
+    def _take_idle(self) -> list[PCPClient]:
+        """Remove clients idle for longer than idle_timeout and return them."""
+        cutoff = time.monotonic() - self._idle_timeout
+        idle = [
+            host
+            for host, entry in self._clients.items()
+            if entry.in_use == 0 and entry.last_used < cutoff
+        ]
+        return [self._clients.pop(host).client for host in idle]
+
+    @staticmethod
+    async def _close_clients(clients: list[PCPClient]) -> None:
+        for client in clients:
+            await client.__aexit__(None, None, None)
+
+    async def aclose(self) -> None:
+        """Close every pooled client and abort connects still in progress."""
+        connecting, self._connecting = self._connecting, {}
+        for task in connecting.values():
+            task.cancel()
+        clients, self._clients = self._clients, {}
+        await self._close_clients([entry.client for entry in clients.values()])
+
+    def __len__(self) -> int:
+        """Number of open pooled clients."""
+        return len(self._clients)
+
+
 def _validate_context(ctx: Context) -> None:
     """Validate context has lifespan_context available.
 
@@ -69,8 +184,9 @@ async def get_client_for_host(ctx: Context, host: str | None = None) -> AsyncIte
     """Get a PCPClient for the specified host.
 
     If host is None or matches the configured target_host, yields the existing
-    lifespan client. Otherwise, creates a new ad-hoc client for the specified
-    hostspec and cleans it up on exit.
+    lifespan client. Otherwise, borrows a client for the specified hostspec from
+    the lifespan's HostClientPool, or creates an ad-hoc client and cleans it up
+    on exit when no pool is configured.
 
     Args:
         ctx: MCP context.
@@ -94,6 +210,14 @@ async def get_client_for_host(ctx: Context, host: str | None = None) -> AsyncIte
             f"Configure PCP_ALLOWED_HOSTS to permit additional hosts."
         )
 
+    assert ctx.request_context is not None
+    assert ctx.request_context.lifespan_context is not None
+    pool: HostClientPool | None = ctx.request_context.lifespan_context.get("host_clients")
+    if pool is not None:
+        async with pool.acquire(host) as client:
+            yield client
+        return
+
     async with PCPClient(
         base_url=settings.base_url,
         target_host=host,
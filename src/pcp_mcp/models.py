@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MetricValue(BaseModel):
@@ -60,6 +60,8 @@ class InstancedMetric(BaseModel):
 class CPUMetrics(BaseModel):
     """CPU utilization summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     user_percent: float = Field(description="User CPU time percentage")
     system_percent: float = Field(description="System CPU time percentage")
     idle_percent: float = Field(description="Idle CPU time percentage")
@@ -71,6 +73,8 @@ class CPUMetrics(BaseModel):
 class MemoryMetrics(BaseModel):
     """Memory utilization summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_bytes: int = Field(description="Total physical memory")
     used_bytes: int = Field(description="Used memory")
     free_bytes: int = Field(description="Free memory")
@@ -86,6 +90,8 @@ class MemoryMetrics(BaseModel):
 class DiskMetrics(BaseModel):
     """Disk I/O summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     read_bytes_per_sec: float = Field(description="Read throughput in bytes/sec")
     write_bytes_per_sec: float = Field(description="Write throughput in bytes/sec")
     reads_per_sec: float = Field(description="Read operations per second")
@@ -96,6 +102,8 @@ class DiskMetrics(BaseModel):
 class NetworkMetrics(BaseModel):
     """Network I/O summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     in_bytes_per_sec: float = Field(description="Inbound throughput in bytes/sec")
     out_bytes_per_sec: float = Field(description="Outbound throughput in bytes/sec")
     in_packets_per_sec: float = Field(description="Inbound packets per second")
@@ -106,6 +114,8 @@ class NetworkMetrics(BaseModel):
 class LoadMetrics(BaseModel):
     """System load summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     load_1m: float = Field(description="1-minute load average")
     load_5m: float = Field(description="5-minute load average")
     load_15m: float = Field(description="15-minute load average")
@@ -117,6 +127,8 @@ class LoadMetrics(BaseModel):
 class SystemSnapshot(BaseModel):
     """Point-in-time system health overview."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: str = Field(description="ISO8601 timestamp")
     hostname: str = Field(description="Target host name")
     cpu: CPUMetrics | None = Field(default=None, description="CPU metrics if requested")
@@ -131,6 +143,8 @@ class SystemSnapshot(BaseModel):
 class ProcessInfo(BaseModel):
     """A process with resource consumption details."""
 
+    model_config = ConfigDict(frozen=True)
+
     pid: int = Field(description="Process ID")
     command: str = Field(description="Command name")
     cmdline: str = Field(description="Full command line (truncated)")
@@ -144,6 +158,8 @@ class ProcessInfo(BaseModel):
 class ProcessTopResult(BaseModel):
     """Top processes by resource consumption."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: str = Field(description="ISO8601 timestamp")
     hostname: str = Field(description="Target host name")
     sort_by: str = Field(description="Resource used for sorting")
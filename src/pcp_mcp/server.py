@@ -13,6 +13,7 @@ from fastmcp.server.providers import FileSystemProvider
 
 from pcp_mcp.client import PCPClient
 from pcp_mcp.config import PCPMCPSettings
+from pcp_mcp.context import HostClientPool
 from pcp_mcp.middleware import MetricCacheMiddleware
 
 
@@ -21,13 +22,14 @@ async def lifespan(mcp: FastMCP) -> AsyncIterator[dict[str, Any]]:
     """Manage PCPClient lifecycle.
 
     Creates a PCPClient for the duration of the server's lifetime,
-    making it available to all tools and resources via the context.
+    making it available to all tools and resources via the context,
+    along with a pool of reusable clients for other allowed hosts.
 
     Args:
         mcp: The FastMCP server instance.
 
     Yields:
-        Context dict with client and settings.
+        Context dict with client, settings, and host client pool.
     """
     settings = PCPMCPSettings()
 
@@ -38,10 +40,15 @@ async def lifespan(mcp: FastMCP) -> AsyncIterator[dict[str, Any]]:
         timeout=settings.timeout,
         verify=settings.verify,
     ) as client:
-        yield {
-            "client": client,
-            "settings": settings,
-        }
+        host_clients = HostClientPool(settings)
+        try:
+            yield {
+                "client": client,
+                "settings": settings,
+                "host_clients": host_clients,
+            }
+        finally:
+            await host_clients.aclose()
 
 
 def create_server() -> FastMCP:
@@ -0,0 +1,24 @@
+"""ToolResult construction shared by the tool modules."""
+
+from __future__ import annotations
+
+from fastmcp.tools import ToolResult
+from pydantic import BaseModel
+
+
+def build_tool_result(result: BaseModel) -> ToolResult:
+    """Wrap a result model as a ToolResult with JSON text and structured content.
+
+    Args:
+        result: Tool result model to return.
+
+    Returns:
+        ToolResult carrying the model as JSON text and structured content.
+    """
+    return ToolResult(
+        content=result.model_dump_json(),
+        structured_content=result.model_dump(),
+    )
+
+
+__all__ = ["build_tool_result"]
@@ -11,6 +11,7 @@ from pydantic import Field
 __all__ = ["query_metrics", "search_metrics", "describe_metric"]
 
 from pcp_mcp.context import get_client_for_host
+from pcp_mcp.errors import handle_pcp_error
 from pcp_mcp.icons import (
     ICON_INFO,
     ICON_METRICS,
@@ -24,6 +25,7 @@ from pcp_mcp.models import (
     MetricSearchResultList,
     MetricValue,
 )
+from pcp_mcp.tools._result import build_tool_result
 from pcp_mcp.utils.extractors import extract_help_text, format_units
 
 TOOL_ANNOTATIONS = ToolAnnotations(readOnlyHint=True, openWorldHint=True)
@@ -60,8 +62,6 @@ async def query_metrics(
     Warning: CPU, disk, and network metrics are counters (cumulative since boot).
     Use get_system_snapshot() instead for rates.
     """
-    from pcp_mcp.errors import handle_pcp_error
-
     async with get_client_for_host(ctx, host) as client:
         try:
             response = await client.fetch(names)
@@ -89,9 +89,10 @@ async def query_metrics(
                     )
                 )
 
+        dumped = [v.model_dump() for v in results]
         return ToolResult(
-            content=json.dumps([v.model_dump() for v in results]),
-            structured_content={"metrics": [v.model_dump() for v in results]},
+            content=json.dumps(dumped),
+            structured_content={"metrics": dumped},
         )
 
 
@@ -124,8 +125,6 @@ async def search_metrics(
         search_metrics("network.interface") - Find per-interface metrics
         search_metrics("kernel", host="db1.example.com") - Search on remote host
     """
-    from pcp_mcp.errors import handle_pcp_error
-
     async with get_client_for_host(ctx, host) as client:
         try:
             metrics = await client.search(pattern)
@@ -140,10 +139,7 @@ async def search_metrics(
             for m in metrics
         ]
         result = MetricSearchResultList(results=results)
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        return build_tool_result(result)
 
 
 @tool(
@@ -177,8 +173,6 @@ async def describe_metric(
     """
     from fastmcp.exceptions import ToolError
 
-    from pcp_mcp.errors import handle_pcp_error
-
     async with get_client_for_host(ctx, host) as client:
         try:
             info = await client.describe(name)
@@ -196,7 +190,4 @@ async def describe_metric(
             help_text=extract_help_text(info),
             indom=info.get("indom"),
         )
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        return build_tool_result(result)
@@ -1,6 +1,5 @@
 """Network protocol statistics tools for TCP/UDP health analysis."""
 
-from datetime import datetime, timezone
 from typing import Annotated, Optional
 
 from fastmcp import Context
@@ -9,12 +8,15 @@ from mcp.types import ToolAnnotations
 from pydantic import Field
 
 from pcp_mcp.context import get_client_for_host
+from pcp_mcp.errors import handle_pcp_error
 from pcp_mcp.icons import ICON_NETWORK, TAGS_NETWORK_STATS
 from pcp_mcp.models import NetworkStatsSnapshot
+from pcp_mcp.tools._result import build_tool_result
 from pcp_mcp.utils.builders import (
     build_interface_errors,
     build_tcp_stats,
     build_udp_stats,
+    utc_now_iso,
 )
 
 __all__ = ["get_network_stats"]
@@ -46,22 +48,24 @@ INTERFACE_ERROR_METRICS = [
 ]
 
 # All TCP/UDP metrics are counters except currestab (instant gauge)
-COUNTER_METRICS = {
-    "network.tcp.activeopens",
-    "network.tcp.passiveopens",
-    "network.tcp.attemptfails",
-    "network.tcp.estabresets",
-    "network.tcp.retranssegs",
-    "network.tcp.inerrs",
-    "network.tcp.outrsts",
-    "network.udp.indatagrams",
-    "network.udp.outdatagrams",
-    "network.udp.inerrors",
-    "network.udp.noports",
-    "network.interface.in.errors",
-    "network.interface.out.errors",
-    "network.interface.in.drops",
-}
+COUNTER_METRICS = frozenset(
+    {
+        "network.tcp.activeopens",
+        "network.tcp.passiveopens",
+        "network.tcp.attemptfails",
+        "network.tcp.estabresets",
+        "network.tcp.retranssegs",
+        "network.tcp.inerrs",
+        "network.tcp.outrsts",
+        "network.udp.indatagrams",
+        "network.udp.outdatagrams",
+        "network.udp.inerrors",
+        "network.udp.noports",
+        "network.interface.in.errors",
+        "network.interface.out.errors",
+        "network.interface.in.drops",
+    }
+)
 
 
 @tool(
@@ -108,20 +112,15 @@ async def get_network_stats(
         get_network_stats(sample_interval=2.0) - Longer sample for accuracy
         get_network_stats(host="web1.example.com") - Query remote host
     """
-    from pcp_mcp.errors import handle_pcp_error
-
     all_metrics = TCP_METRICS + UDP_METRICS + INTERFACE_ERROR_METRICS
 
-    async def report_progress(current: float, total: float, message: str) -> None:
-        await ctx.report_progress(current, total, message)
-
     async with get_client_for_host(ctx, host) as client:
         try:
             data = await client.fetch_with_rates(
                 all_metrics,
                 COUNTER_METRICS,
                 sample_interval,
-                progress_callback=report_progress,
+                progress_callback=ctx.report_progress,
             )
         except Exception as e:
             raise handle_pcp_error(e, "fetching network stats") from e
@@ -138,17 +137,14 @@ async def get_network_stats(
         await ctx.report_progress(100, 100, "Complete")
 
         result = NetworkStatsSnapshot(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_now_iso(),
             hostname=client.target_host,
             tcp=tcp,
             udp=udp,
             interface_errors=iface_errors,
             assessment=assessment,
         )
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        return build_tool_result(result)
 
 
 def _assess_network_stats(tcp, udp, iface_errors) -> str:
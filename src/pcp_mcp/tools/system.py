@@ -1,14 +1,23 @@
 """System health tools for clumped metric queries."""
 
-from datetime import datetime, timezone
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import suppress
+from functools import partial
+from itertools import combinations
+from operator import attrgetter
 from typing import Annotated, Any, Literal, Optional
 
+from cachetools import TTLCache
 from fastmcp import Context
 from fastmcp.tools import ToolResult, tool
 from mcp.types import ToolAnnotations
 from pydantic import Field
 
-from pcp_mcp.context import get_client_for_host
+from pcp_mcp.config import MAX_SNAPSHOT_TTL
+from pcp_mcp.context import get_client_for_host, get_settings
+from pcp_mcp.errors import handle_pcp_error
 from pcp_mcp.icons import (
     ICON_DIAGNOSE,
     ICON_FILESYSTEM,
@@ -28,6 +37,7 @@ from pcp_mcp.models import (
     ProcessTopResult,
     SystemSnapshot,
 )
+from pcp_mcp.tools._result import build_tool_result
 from pcp_mcp.utils.builders import (
     assess_processes,
     build_cpu_metrics,
@@ -36,9 +46,9 @@ from pcp_mcp.utils.builders import (
     build_memory_metrics,
     build_network_metrics,
     build_process_list,
-    get_sort_key,
+    utc_now_iso,
 )
-from pcp_mcp.utils.extractors import get_scalar_value
+from pcp_mcp.utils.extractors import get_first_value
 
 __all__ = [
     "get_system_snapshot",
@@ -88,28 +98,123 @@ SNAPSHOT_METRICS = {
     ],
 }
 
-COUNTER_METRICS = {
-    "kernel.all.cpu.user",
-    "kernel.all.cpu.sys",
-    "kernel.all.cpu.idle",
-    "kernel.all.cpu.wait.total",
-    "disk.all.read_bytes",
-    "disk.all.write_bytes",
-    "disk.all.read",
-    "disk.all.write",
-    "network.interface.in.bytes",
-    "network.interface.out.bytes",
-    "network.interface.in.packets",
-    "network.interface.out.packets",
-}
+COUNTER_METRICS = frozenset(
+    {
+        "kernel.all.cpu.user",
+        "kernel.all.cpu.sys",
+        "kernel.all.cpu.idle",
+        "kernel.all.cpu.wait.total",
+        "disk.all.read_bytes",
+        "disk.all.write_bytes",
+        "disk.all.read",
+        "disk.all.write",
+        "network.interface.in.bytes",
+        "network.interface.out.bytes",
+        "network.interface.in.packets",
+        "network.interface.out.packets",
+    }
+)
+
+PROC_COUNTER_METRICS = frozenset(
+    {
+        "proc.psinfo.utime",
+        "proc.psinfo.stime",
+        "proc.io.read_bytes",
+        "proc.io.write_bytes",
+    }
+)
+
+# Category name doubles as the SystemSnapshot field the builder populates.
+SNAPSHOT_BUILDERS = (
+    ("cpu", build_cpu_metrics),
+    ("memory", build_memory_metrics),
+    ("load", build_load_metrics),
+    ("disk", build_disk_metrics),
+    ("network", build_network_metrics),
+)
 
 PROCESS_METRICS = {
     "cpu": ["proc.psinfo.utime", "proc.psinfo.stime"],
     "memory": ["proc.memory.rss"],
     "io": ["proc.io.read_bytes", "proc.io.write_bytes"],
     "info": ["proc.psinfo.pid", "proc.psinfo.cmd", "proc.psinfo.psargs"],
+    # Gauges sampled alongside the process counters so no extra fetch is needed.
+    "system": ["hinv.ncpu", "mem.physmem"],
 }
 
+
+def _dedupe_metrics(*groups: list[str]) -> tuple[str, ...]:
+    """Concatenate metric name lists, dropping repeats but keeping order."""
+    return tuple(dict.fromkeys(name for group in groups for name in group))
+
+
+# Metric lists are static, so resolve every category combination up front.
+_SNAPSHOT_METRIC_SETS: dict[frozenset[str], tuple[str, ...]] = {
+    frozenset(combo): _dedupe_metrics(*(SNAPSHOT_METRICS[cat] for cat in combo))
+    for size in range(len(SNAPSHOT_METRICS) + 1)
+    for combo in combinations(SNAPSHOT_METRICS, size)
+}
+
+_PROCESS_TOP_METRICS: dict[str, tuple[str, ...]] = {
+    sort_by: _dedupe_metrics(
+        PROCESS_METRICS["info"],
+        PROCESS_METRICS["memory"],
+        PROCESS_METRICS["system"],
+        PROCESS_METRICS[sort_by],
+    )
+    for sort_by in ("cpu", "memory", "io")
+}
+
+# Fixed category sets for the tools that don't take a categories argument.
+QUICK_HEALTH_CATEGORIES = frozenset({"cpu", "memory"})
+DIAGNOSE_CATEGORIES = frozenset({"cpu", "memory", "load"})
+QUICK_SAMPLE_INTERVAL = 0.5
+# smart_diagnose hands metrics to an LLM, so a few seconds of staleness is fine.
+DIAGNOSE_MAX_AGE = 5.0
+
+# Agents often repeat a snapshot or process query within seconds; serve those
+# from the previous sample instead of paying sample_interval again. Freshness
+# comes from settings.snapshot_ttl, which is capped at the cache retention.
+SNAPSHOT_CACHE_RETENTION_SECONDS = MAX_SNAPSHOT_TTL
+CACHE_MAX_SIZE = 64
+
+
+class _ProgressFanout:
+    """Forward progress from a shared sample to every caller still waiting on it.
+
+    A failing callback, e.g. from a cancelled request, never fails the sample.
+    """
+
+    def __init__(self) -> None:
+        self.listeners: list[Callable[[float, float, str], Awaitable[None]]] = []
+
+    async def __call__(self, progress: float, total: float, message: str) -> None:
+        for listener in list(self.listeners):
+            with suppress(Exception):
+                await listener(progress, total, message)
+
+
+_snapshot_cache: TTLCache[tuple, tuple[float, SystemSnapshot]] = TTLCache(
+    maxsize=CACHE_MAX_SIZE, ttl=SNAPSHOT_CACHE_RETENTION_SECONDS
+)
+_snapshot_inflight: dict[tuple, tuple[asyncio.Task[SystemSnapshot], _ProgressFanout]] = {}
+_process_top_cache: TTLCache[tuple, tuple[float, ProcessTopResult]] = TTLCache(
+    maxsize=CACHE_MAX_SIZE, ttl=SNAPSHOT_CACHE_RETENTION_SECONDS
+)
+
+
+def clear_snapshot_cache() -> None:
+    """Drop all cached system snapshots and process listings."""
+    _snapshot_cache.clear()
+    _snapshot_inflight.clear()
+    _process_top_cache.clear()
+
+
+def _cache_host(ctx: Context, host: str | None) -> str | None:
+    """Normalize host for cache keys; the configured target host maps to None."""
+    return None if host == get_settings(ctx).target_host else host
+
+
 FILESYSTEM_METRICS = [
     "filesys.mountdir",
     "filesys.capacity",
@@ -122,20 +227,122 @@ FILESYSTEM_METRICS = [
 
 async def _fetch_system_snapshot(
     ctx: Context,
-    categories: list[str],
+    categories: Iterable[str],
     sample_interval: float,
     host: str | None,
+    max_age: float | None = None,
 ) -> SystemSnapshot:
-    """Core logic for fetching a system snapshot."""
-    from pcp_mcp.errors import handle_pcp_error
+    """Core logic for fetching a system snapshot.
+
+    Returns a cached snapshot when one with the same arguments is younger than
+    settings.snapshot_ttl. Concurrent identical requests share a single sample.
+
+    Args:
+        ctx: MCP context.
+        categories: Snapshot categories to include.
+        sample_interval: Seconds between samples for rate calculation.
+        host: Target pmcd hostspec, or None for the default.
+        max_age: Best-effort freshness for callers that can tolerate older
+            data. When set, any cached snapshot for the host younger than this
+            is reused, whatever its sample interval, as long as it covers the
+            requested categories. Ignored when settings.snapshot_ttl is 0.
+    """
+    requested = frozenset(categories)
+    if not requested <= SNAPSHOT_METRICS.keys():
+        requested = requested.intersection(SNAPSHOT_METRICS)
+    host = _cache_host(ctx, host)
+    cache_key = (host, requested, sample_interval)
+
+    snapshot = _get_cached_snapshot(cache_key, get_settings(ctx).snapshot_ttl, max_age)
+    if snapshot is None:
+        snapshot = await _await_shared_sample(ctx, cache_key)
+
+    await ctx.report_progress(100, 100, "Complete")
+    return snapshot
+
+
+def _get_cached_snapshot(
+    cache_key: tuple, snapshot_ttl: float, max_age: float | None
+) -> SystemSnapshot | None:
+    """Get a reusable cached snapshot for cache_key, if there is one."""
+    cached = _snapshot_cache.get(cache_key)
+    if cached is not None:
+        fetched_at, snapshot = cached
+        if time.monotonic() - fetched_at < snapshot_ttl:
+            return snapshot
+
+    # A zero TTL turns snapshot reuse off entirely, max_age included.
+    if max_age is not None and snapshot_ttl > 0:
+        host, requested, _ = cache_key
+        return _find_covering_snapshot(host, requested, max_age)
+    return None
+
+
+async def _await_shared_sample(ctx: Context, cache_key: tuple) -> SystemSnapshot:
+    """Wait for the in-flight sample for cache_key, starting one if needed."""
+    inflight = _snapshot_inflight.get(cache_key)
+    if inflight is None:
+        host, requested, sample_interval = cache_key
+        fanout = _ProgressFanout()
+        task = asyncio.ensure_future(
+            _sample_system_snapshot(ctx, requested, sample_interval, host, fanout)
+        )
+        inflight = _snapshot_inflight[cache_key] = (task, fanout)
+        task.add_done_callback(partial(_store_snapshot, cache_key))
+
+    # Each waiter gets progress on its own context and only while it waits;
+    # shield so one caller being cancelled doesn't cancel the shared sample.
+    task, fanout = inflight
+    report_progress = ctx.report_progress
+    fanout.listeners.append(report_progress)
+    try:
+        return await asyncio.shield(task)
+    finally:
+        fanout.listeners.remove(report_progress)
+
+
+def _find_covering_snapshot(
+    host: str | None, requested: frozenset[str], max_age: float
+) -> SystemSnapshot | None:
+    """Find the newest cached snapshot for host covering the requested categories."""
+    cutoff = time.monotonic() - max_age
+    best: tuple[float, frozenset[str], SystemSnapshot] | None = None
+    for (cached_host, categories, _), (fetched_at, snapshot) in list(_snapshot_cache.items()):
+        if cached_host != host or fetched_at <= cutoff or not requested <= categories:
+            continue
+        if best is None or fetched_at > best[0]:
+            best = (fetched_at, categories, snapshot)
 
-    all_metrics: list[str] = []
-    for cat in categories:
-        if cat in SNAPSHOT_METRICS:
-            all_metrics.extend(SNAPSHOT_METRICS[cat])
+    if best is None:
+        return None
+    _, categories, snapshot = best
+    if categories == requested:
+        return snapshot
+    return snapshot.model_copy(update=dict.fromkeys(categories - requested))
+
+
+def _store_snapshot(cache_key: tuple, task: asyncio.Task[SystemSnapshot]) -> None:
+    """Cache a finished snapshot sample and release its in-flight slot."""
+    inflight = _snapshot_inflight.get(cache_key)
+    if inflight is not None and inflight[0] is task:
+        del _snapshot_inflight[cache_key]
+    if not task.cancelled() and task.exception() is None:
+        _snapshot_cache[cache_key] = (time.monotonic(), task.result())
 
-    async def report_progress(current: float, total: float, message: str) -> None:
-        await ctx.report_progress(current, total, message)
+
+async def _sample_system_snapshot(
+    ctx: Context,
+    requested: frozenset[str],
+    sample_interval: float,
+    host: str | None,
+    report_progress: _ProgressFanout,
+) -> SystemSnapshot:
+    """Sample pmproxy and build a snapshot of the requested categories.
+
+    Progress goes to report_progress rather than ctx, since the sample is
+    shared by every caller waiting on it.
+    """
+    all_metrics = _SNAPSHOT_METRIC_SETS[requested]
 
     async with get_client_for_host(ctx, host) as client:
         try:
@@ -148,25 +355,17 @@ async def _fetch_system_snapshot(
         except Exception as e:
             raise handle_pcp_error(e, "fetching system snapshot") from e
 
-        await ctx.report_progress(95, 100, "Building snapshot...")
+        await report_progress(95, 100, "Building snapshot...")
 
         snapshot = SystemSnapshot(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_now_iso(),
             hostname=client.target_host,
+            **{
+                category: builder(data)
+                for category, builder in SNAPSHOT_BUILDERS
+                if category in requested
+            },
         )
-
-        if "cpu" in categories:
-            snapshot.cpu = build_cpu_metrics(data)
-        if "memory" in categories:
-            snapshot.memory = build_memory_metrics(data)
-        if "load" in categories:
-            snapshot.load = build_load_metrics(data)
-        if "disk" in categories:
-            snapshot.disk = build_disk_metrics(data)
-        if "network" in categories:
-            snapshot.network = build_network_metrics(data)
-
-        await ctx.report_progress(100, 100, "Complete")
         return snapshot
 
 
@@ -222,10 +421,7 @@ async def get_system_snapshot(
     if categories is None:
         categories = ["cpu", "memory", "disk", "network", "load"]
     result = await _fetch_system_snapshot(ctx, categories, sample_interval, host)
-    return ToolResult(
-        content=result.model_dump_json(),
-        structured_content=result.model_dump(),
-    )
+    return build_tool_result(result)
 
 
 @tool(
@@ -250,11 +446,8 @@ async def quick_health(
         quick_health() - Fast health check on default host
         quick_health(host="web1.example.com") - Fast check on remote host
     """
-    result = await _fetch_system_snapshot(ctx, ["cpu", "memory"], 0.5, host)
-    return ToolResult(
-        content=result.model_dump_json(),
-        structured_content=result.model_dump(),
-    )
+    result = await _fetch_system_snapshot(ctx, QUICK_HEALTH_CATEGORIES, QUICK_SAMPLE_INTERVAL, host)
+    return build_tool_result(result)
 
 
 @tool(
@@ -298,52 +491,40 @@ async def get_process_top(
         get_process_top(sort_by="io", sample_interval=2.0) - Top I/O with longer sample
         get_process_top(host="db1.example.com") - Query remote host
     """
-    all_metrics = (
-        PROCESS_METRICS["info"] + PROCESS_METRICS["memory"] + PROCESS_METRICS.get(sort_by, [])
-    )
-    if sort_by == "cpu":
-        all_metrics.extend(PROCESS_METRICS["cpu"])
-    elif sort_by == "io":
-        all_metrics.extend(PROCESS_METRICS["io"])
-
-    all_metrics = list(set(all_metrics))
-    system_metrics = ["hinv.ncpu", "mem.physmem"]
+    host = _cache_host(ctx, host)
+    cache_key = (host, sort_by, limit, sample_interval)
+    cached = _process_top_cache.get(cache_key)
+    if cached is not None:
+        fetched_at, cached_result = cached
+        if time.monotonic() - fetched_at < get_settings(ctx).snapshot_ttl:
+            await ctx.report_progress(100, 100, "Complete")
+            return build_tool_result(cached_result)
 
-    counter_metrics = {
-        "proc.psinfo.utime",
-        "proc.psinfo.stime",
-        "proc.io.read_bytes",
-        "proc.io.write_bytes",
-    }
-
-    from pcp_mcp.errors import handle_pcp_error
-
-    async def report_progress(current: float, total: float, message: str) -> None:
-        await ctx.report_progress(current, total, message)
+    all_metrics = _PROCESS_TOP_METRICS[sort_by]
 
     async with get_client_for_host(ctx, host) as client:
         try:
             proc_data = await client.fetch_with_rates(
-                all_metrics, counter_metrics, sample_interval, progress_callback=report_progress
+                all_metrics,
+                PROC_COUNTER_METRICS,
+                sample_interval,
+                progress_callback=ctx.report_progress,
             )
-            sys_data = await client.fetch(system_metrics)
         except Exception as e:
             raise handle_pcp_error(e, "fetching process data") from e
 
         await ctx.report_progress(92, 100, "Processing results...")
 
-        ncpu = get_scalar_value(sys_data, "hinv.ncpu", 1)
-        total_mem = get_scalar_value(sys_data, "mem.physmem", 1) * 1024
+        ncpu = int(get_first_value(proc_data, "hinv.ncpu", 1))
+        total_mem = int(get_first_value(proc_data, "mem.physmem", 1)) * 1024
 
-        processes = build_process_list(proc_data, sort_by, total_mem, ncpu)
-        processes.sort(key=lambda p: get_sort_key(p, sort_by), reverse=True)
-        processes = processes[:limit]
+        processes = build_process_list(proc_data, sort_by, total_mem, ncpu, limit=limit)
 
         assessment = assess_processes(processes, sort_by, ncpu)
 
         await ctx.report_progress(100, 100, "Complete")
         result = ProcessTopResult(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_now_iso(),
             hostname=client.target_host,
             sort_by=sort_by,
             sample_interval=sample_interval,
@@ -352,10 +533,8 @@ async def get_process_top(
             ncpu=ncpu,
             assessment=assessment,
         )
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        _process_top_cache[cache_key] = (time.monotonic(), result)
+        return build_tool_result(result)
 
 
 @tool(
@@ -373,8 +552,9 @@ async def smart_diagnose(
 ) -> ToolResult:
     """Use LLM to analyze system metrics and provide diagnosis.
 
-    Collects a quick system snapshot (CPU, memory, load) and asks the
-    connected LLM to analyze the metrics and provide actionable insights.
+    Collects a quick system snapshot (CPU, memory, load), reusing one taken in
+    the last few seconds if available, and asks the connected LLM to analyze
+    the metrics and provide actionable insights.
 
     This tool demonstrates FastMCP's LLM sampling capability, where the
     MCP server can request LLM assistance for complex analysis tasks.
@@ -383,10 +563,10 @@ async def smart_diagnose(
         smart_diagnose() - Analyze default host
         smart_diagnose(host="db1.example.com") - Analyze remote host
     """
-    from pcp_mcp.errors import handle_pcp_error
-
     try:
-        snapshot = await _fetch_system_snapshot(ctx, ["cpu", "memory", "load"], 0.5, host)
+        snapshot = await _fetch_system_snapshot(
+            ctx, DIAGNOSE_CATEGORIES, QUICK_SAMPLE_INTERVAL, host, max_age=DIAGNOSE_MAX_AGE
+        )
     except Exception as e:
         raise handle_pcp_error(e, "fetching metrics for diagnosis") from e
 
@@ -410,16 +590,10 @@ async def smart_diagnose(
         result = sampling_result.result
         result.timestamp = snapshot.timestamp
         result.hostname = snapshot.hostname
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        return build_tool_result(result)
     except Exception:
         result = _build_fallback_diagnosis(snapshot)
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        return build_tool_result(result)
 
 
 @tool(
@@ -445,8 +619,6 @@ async def get_filesystem_usage(
         get_filesystem_usage() - Check all filesystems on default host
         get_filesystem_usage(host="db1.example.com") - Check remote host
     """
-    from pcp_mcp.errors import handle_pcp_error
-
     async with get_client_for_host(ctx, host) as client:
         try:
             response = await client.fetch(FILESYSTEM_METRICS)
@@ -457,39 +629,40 @@ async def get_filesystem_usage(
         assessment = _assess_filesystems(filesystems)
 
         result = FilesystemSnapshot(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_now_iso(),
             hostname=client.target_host,
             filesystems=filesystems,
             assessment=assessment,
         )
-        return ToolResult(
-            content=result.model_dump_json(),
-            structured_content=result.model_dump(),
-        )
+        return build_tool_result(result)
 
 
 def _build_filesystem_list(response: dict) -> list[FilesystemInfo]:
     """Build list of FilesystemInfo from pmproxy response."""
-    values = response.get("values", [])
-
-    metrics_by_name: dict[str, dict[int, Any]] = {}
-    for metric in values:
-        name = metric.get("name", "")
-        instances = metric.get("instances", [])
-        metrics_by_name[name] = {inst.get("instance", -1): inst.get("value") for inst in instances}
+    metrics_by_name: dict[str, dict[int, Any]] = {
+        metric.get("name", ""): {
+            inst.get("instance", -1): inst.get("value") for inst in metric.get("instances", ())
+        }
+        for metric in response.get("values", ())
+    }
 
     mountdir_instances = metrics_by_name.get("filesys.mountdir", {})
+    capacity = metrics_by_name.get("filesys.capacity", {})
+    used = metrics_by_name.get("filesys.used", {})
+    avail = metrics_by_name.get("filesys.avail", {})
+    full = metrics_by_name.get("filesys.full", {})
+    types = metrics_by_name.get("filesys.type", {})
 
     filesystems: list[FilesystemInfo] = []
     for instance_id, mount_point in mountdir_instances.items():
         if mount_point is None:
             continue
 
-        capacity_kb = metrics_by_name.get("filesys.capacity", {}).get(instance_id, 0) or 0
-        used_kb = metrics_by_name.get("filesys.used", {}).get(instance_id, 0) or 0
-        avail_kb = metrics_by_name.get("filesys.avail", {}).get(instance_id, 0) or 0
-        percent_full = metrics_by_name.get("filesys.full", {}).get(instance_id, 0.0) or 0.0
-        fs_type = metrics_by_name.get("filesys.type", {}).get(instance_id, "unknown") or "unknown"
+        capacity_kb = capacity.get(instance_id, 0) or 0
+        used_kb = used.get(instance_id, 0) or 0
+        avail_kb = avail.get(instance_id, 0) or 0
+        percent_full = full.get(instance_id, 0.0) or 0.0
+        fs_type = types.get(instance_id, "unknown") or "unknown"
 
         filesystems.append(
             FilesystemInfo(
@@ -502,7 +675,7 @@ def _build_filesystem_list(response: dict) -> list[FilesystemInfo]:
             )
         )
 
-    filesystems.sort(key=lambda fs: fs.mount_point)
+    filesystems.sort(key=attrgetter("mount_point"))
     return filesystems
 
 
@@ -511,61 +684,56 @@ def _assess_filesystems(filesystems: list[FilesystemInfo]) -> str:
     if not filesystems:
         return "No filesystems found"
 
-    critical = [fs for fs in filesystems if fs.percent_full >= 90]
-    warning = [fs for fs in filesystems if 80 <= fs.percent_full < 90]
+    critical: list[str] = []
+    warning: list[str] = []
+    for fs in filesystems:
+        if fs.percent_full >= 90:
+            critical.append(fs.mount_point)
+        elif fs.percent_full >= 80:
+            warning.append(fs.mount_point)
 
     if critical:
-        mounts = ", ".join(fs.mount_point for fs in critical)
-        return f"🔴 Critical: {mounts} at 90%+ capacity"
+        return f"🔴 Critical: {', '.join(critical)} at 90%+ capacity"
     if warning:
-        mounts = ", ".join(fs.mount_point for fs in warning)
-        return f"🟡 Warning: {mounts} at 80%+ capacity"
+        return f"🟡 Warning: {', '.join(warning)} at 80%+ capacity"
     return "🟢 All filesystems healthy"
 
 
+_GIB = 1024**3
+
+
 def _format_snapshot_for_llm(snapshot: SystemSnapshot) -> str:
     """Format a system snapshot as text for LLM analysis."""
-    lines = [f"Host: {snapshot.hostname}", f"Time: {snapshot.timestamp}", ""]
-
-    if snapshot.cpu:
-        lines.extend(
-            [
-                "CPU:",
-                f"  User: {snapshot.cpu.user_percent:.1f}%",
-                f"  System: {snapshot.cpu.system_percent:.1f}%",
-                f"  Idle: {snapshot.cpu.idle_percent:.1f}%",
-                f"  I/O Wait: {snapshot.cpu.iowait_percent:.1f}%",
-                f"  CPUs: {snapshot.cpu.ncpu}",
-                "",
-            ]
+    sections = [f"Host: {snapshot.hostname}\nTime: {snapshot.timestamp}\n"]
+
+    if cpu := snapshot.cpu:
+        sections.append(
+            "CPU:\n"
+            f"  User: {cpu.user_percent:.1f}%\n"
+            f"  System: {cpu.system_percent:.1f}%\n"
+            f"  Idle: {cpu.idle_percent:.1f}%\n"
+            f"  I/O Wait: {cpu.iowait_percent:.1f}%\n"
+            f"  CPUs: {cpu.ncpu}\n"
         )
 
-    if snapshot.memory:
-        total_gb = snapshot.memory.total_bytes / (1024**3)
-        avail_gb = snapshot.memory.available_bytes / (1024**3)
-        lines.extend(
-            [
-                "Memory:",
-                f"  Total: {total_gb:.1f} GB",
-                f"  Available: {avail_gb:.1f} GB",
-                f"  Used: {snapshot.memory.used_percent:.1f}%",
-                f"  Swap Used: {snapshot.memory.swap_used_bytes / (1024**3):.1f} GB",
-                "",
-            ]
+    if memory := snapshot.memory:
+        sections.append(
+            "Memory:\n"
+            f"  Total: {memory.total_bytes / _GIB:.1f} GB\n"
+            f"  Available: {memory.available_bytes / _GIB:.1f} GB\n"
+            f"  Used: {memory.used_percent:.1f}%\n"
+            f"  Swap Used: {memory.swap_used_bytes / _GIB:.1f} GB\n"
         )
 
-    if snapshot.load:
-        lines.extend(
-            [
-                "Load:",
-                f"  1m/5m/15m: {snapshot.load.load_1m:.2f} / "
-                f"{snapshot.load.load_5m:.2f} / {snapshot.load.load_15m:.2f}",
-                f"  Runnable: {snapshot.load.runnable}",
-                f"  Total procs: {snapshot.load.nprocs}",
-            ]
+    if load := snapshot.load:
+        sections.append(
+            "Load:\n"
+            f"  1m/5m/15m: {load.load_1m:.2f} / {load.load_5m:.2f} / {load.load_15m:.2f}\n"
+            f"  Runnable: {load.runnable}\n"
+            f"  Total procs: {load.nprocs}"
         )
 
-    return "\n".join(lines)
+    return "\n".join(sections)
 
 
 def _build_fallback_diagnosis(snapshot: SystemSnapshot) -> DiagnosisResult:
@@ -17,15 +17,19 @@ from pcp_mcp.utils.extractors import (
     extract_help_text,
     extract_timestamp,
     get_first_value,
+    get_first_values,
     get_scalar_value,
     sum_instances,
+    sum_instances_each,
 )
 
 __all__ = [
     # Extractors
     "get_first_value",
+    "get_first_values",
     "get_scalar_value",
     "sum_instances",
+    "sum_instances_each",
     "extract_help_text",
     "extract_timestamp",
     # Builders
@@ -5,6 +5,13 @@ Consolidated metric builders extracted from tools/system.py to follow DRY princi
 
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_left
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
 from pcp_mcp.models import (
     CPUMetrics,
     DiskMetrics,
@@ -16,25 +23,75 @@ from pcp_mcp.models import (
     TCPStats,
     UDPStats,
 )
-from pcp_mcp.utils.extractors import get_first_value, sum_instances
+from pcp_mcp.utils.extractors import get_first_value, get_first_values, sum_instances_each
+
+# The snapshot and process builders below produce correctly typed values, so they
+# use model_construct() to skip pydantic validation on these hot paths.
+
+_CPU_METRICS = (
+    "kernel.all.cpu.user",
+    "kernel.all.cpu.sys",
+    "kernel.all.cpu.idle",
+    "kernel.all.cpu.wait.total",
+)
+_MEMORY_METRICS = (
+    "mem.physmem",
+    "mem.util.available",
+    "mem.util.free",
+    "mem.util.cached",
+    "mem.util.bufmem",
+    "mem.util.swapTotal",
+    "mem.util.swapFree",
+)
+_DISK_METRICS = (
+    "disk.all.read_bytes",
+    "disk.all.write_bytes",
+    "disk.all.read",
+    "disk.all.write",
+)
+_NETWORK_METRICS = (
+    "network.interface.in.bytes",
+    "network.interface.out.bytes",
+    "network.interface.in.packets",
+    "network.interface.out.packets",
+)
+
+# Ascending (elevated, high) thresholds for the bucketed assessments, looked up with
+# bisect_left so a value must exceed a threshold to move up a level.
+_MEMORY_USED_PCT_THRESHOLDS = (75.0, 90.0)
+_DISK_BYTES_THRESHOLDS = (10_000_000.0, 100_000_000.0)
+_NETWORK_BYTES_THRESHOLDS = (10_000_000.0, 100_000_000.0)
+
+_TCP_METRICS = (
+    "network.tcp.activeopens",
+    "network.tcp.passiveopens",
+    "network.tcp.attemptfails",
+    "network.tcp.estabresets",
+    "network.tcp.currestab",
+    "network.tcp.retranssegs",
+    "network.tcp.inerrs",
+    "network.tcp.outrsts",
+)
+_UDP_METRICS = (
+    "network.udp.indatagrams",
+    "network.udp.outdatagrams",
+    "network.udp.inerrors",
+    "network.udp.noports",
+)
 
 
 def build_cpu_metrics(data: dict) -> CPUMetrics:
     """Build CPU metrics from fetched data."""
-    user = get_first_value(data, "kernel.all.cpu.user")
-    sys = get_first_value(data, "kernel.all.cpu.sys")
-    idle = get_first_value(data, "kernel.all.cpu.idle")
-    iowait = get_first_value(data, "kernel.all.cpu.wait.total")
+    user, sys, idle, iowait = get_first_values(data, _CPU_METRICS)
     ncpu = int(get_first_value(data, "hinv.ncpu", 1))
 
     total = user + sys + idle + iowait
-    if total > 0:
-        user_pct = (user / total) * 100
-        sys_pct = (sys / total) * 100
-        idle_pct = (idle / total) * 100
-        iowait_pct = (iowait / total) * 100
-    else:
-        user_pct = sys_pct = idle_pct = iowait_pct = 0.0
+    scale = 100.0 / total if total > 0 else 0.0
+    # Round once and assess on the reported values so the two always agree.
+    user_pct = round(user * scale, 1)
+    sys_pct = round(sys * scale, 1)
+    idle_pct = round(idle * scale, 1)
+    iowait_pct = round(iowait * scale, 1)
 
     if iowait_pct > 20:
         assessment = "High I/O wait - system is disk bound"
@@ -47,11 +104,11 @@ def build_cpu_metrics(data: dict) -> CPUMetrics:
     else:
         assessment = "CPU utilization is normal"
 
-    return CPUMetrics(
-        user_percent=round(user_pct, 1),
-        system_percent=round(sys_pct, 1),
-        idle_percent=round(idle_pct, 1),
-        iowait_percent=round(iowait_pct, 1),
+    return CPUMetrics.model_construct(
+        user_percent=user_pct,
+        system_percent=sys_pct,
+        idle_percent=idle_pct,
+        iowait_percent=iowait_pct,
         ncpu=ncpu,
         assessment=assessment,
     )
@@ -59,28 +116,24 @@ def build_cpu_metrics(data: dict) -> CPUMetrics:
 
 def build_memory_metrics(data: dict) -> MemoryMetrics:
     """Build memory metrics from fetched data."""
-    total = int(get_first_value(data, "mem.physmem")) * 1024
-    available = int(get_first_value(data, "mem.util.available")) * 1024
-    free = int(get_first_value(data, "mem.util.free")) * 1024
-    cached = int(get_first_value(data, "mem.util.cached")) * 1024
-    buffers = int(get_first_value(data, "mem.util.bufmem")) * 1024
-    swap_total = int(get_first_value(data, "mem.util.swapTotal")) * 1024
-    swap_free = int(get_first_value(data, "mem.util.swapFree")) * 1024
+    total, available, free, cached, buffers, swap_total, swap_free = (
+        int(value) * 1024 for value in get_first_values(data, _MEMORY_METRICS)
+    )
     swap_used = swap_total - swap_free
 
     used = total - available
-    used_pct = (used / total * 100) if total > 0 else 0.0
+    used_pct = round(used / total * 100, 1) if total > 0 else 0.0
 
     if swap_used > swap_total * 0.5:
         assessment = "Heavy swap usage - memory pressure"
-    elif used_pct > 90:
-        assessment = "Memory usage is critical"
-    elif used_pct > 75:
-        assessment = "Memory usage is elevated"
     else:
-        assessment = "Memory utilization is normal"
+        assessment = (
+            "Memory utilization is normal",
+            "Memory usage is elevated",
+            "Memory usage is critical",
+        )[bisect_left(_MEMORY_USED_PCT_THRESHOLDS, used_pct)]
 
-    return MemoryMetrics(
+    return MemoryMetrics.model_construct(
         total_bytes=total,
         used_bytes=used,
         free_bytes=free,
@@ -89,7 +142,7 @@ def build_memory_metrics(data: dict) -> MemoryMetrics:
         buffers_bytes=buffers,
         swap_used_bytes=swap_used,
         swap_total_bytes=swap_total,
-        used_percent=round(used_pct, 1),
+        used_percent=used_pct,
         assessment=assessment,
     )
 
@@ -113,7 +166,7 @@ def build_load_metrics(data: dict) -> LoadMetrics:
     else:
         assessment = "Load is normal"
 
-    return LoadMetrics(
+    return LoadMetrics.model_construct(
         load_1m=round(load_1m, 2),
         load_5m=round(load_5m, 2),
         load_15m=round(load_15m, 2),
@@ -125,21 +178,19 @@ def build_load_metrics(data: dict) -> LoadMetrics:
 
 def build_disk_metrics(data: dict) -> DiskMetrics:
     """Build disk I/O metrics from fetched data."""
-    read_bytes = get_first_value(data, "disk.all.read_bytes")
-    write_bytes = get_first_value(data, "disk.all.write_bytes")
-    reads = get_first_value(data, "disk.all.read")
-    writes = get_first_value(data, "disk.all.write")
+    read_bytes, write_bytes, reads, writes = get_first_values(data, _DISK_METRICS)
 
-    if read_bytes > 100_000_000 or write_bytes > 100_000_000:
+    level = bisect_left(_DISK_BYTES_THRESHOLDS, max(read_bytes, write_bytes))
+    if level == 2:
         assessment = (
             f"Heavy disk I/O ({read_bytes / 1e6:.0f} MB/s read, {write_bytes / 1e6:.0f} MB/s write)"
         )
-    elif read_bytes > 10_000_000 or write_bytes > 10_000_000:
+    elif level == 1:
         assessment = "Moderate disk activity"
     else:
         assessment = "Disk I/O is low"
 
-    return DiskMetrics(
+    return DiskMetrics.model_construct(
         read_bytes_per_sec=round(read_bytes, 1),
         write_bytes_per_sec=round(write_bytes, 1),
         reads_per_sec=round(reads, 1),
@@ -150,20 +201,18 @@ def build_disk_metrics(data: dict) -> DiskMetrics:
 
 def build_network_metrics(data: dict) -> NetworkMetrics:
     """Build network I/O metrics from fetched data."""
-    in_bytes = sum_instances(data, "network.interface.in.bytes")
-    out_bytes = sum_instances(data, "network.interface.out.bytes")
-    in_packets = sum_instances(data, "network.interface.in.packets")
-    out_packets = sum_instances(data, "network.interface.out.packets")
+    in_bytes, out_bytes, in_packets, out_packets = sum_instances_each(data, _NETWORK_METRICS)
 
     total_throughput = in_bytes + out_bytes
-    if total_throughput > 100_000_000:
+    level = bisect_left(_NETWORK_BYTES_THRESHOLDS, total_throughput)
+    if level == 2:
         assessment = f"High network throughput ({total_throughput / 1e6:.0f} MB/s)"
-    elif total_throughput > 10_000_000:
+    elif level == 1:
         assessment = "Moderate network activity"
     else:
         assessment = "Network I/O is low"
 
-    return NetworkMetrics(
+    return NetworkMetrics.model_construct(
         in_bytes_per_sec=round(in_bytes, 1),
         out_bytes_per_sec=round(out_bytes, 1),
         in_packets_per_sec=round(in_packets, 1),
@@ -190,7 +239,7 @@ def _calculate_cpu_percent(
     inst_id: str, utime_data: dict, stime_data: dict, include_cpu: bool
 ) -> float | None:
     """Calculate CPU percentage for a process instance."""
-    if not include_cpu and not utime_data:
+    if not include_cpu:
         return None
     utime = float(utime_data.get(inst_id, 0))
     stime = float(stime_data.get(inst_id, 0))
@@ -201,17 +250,25 @@ def _calculate_io_metrics(
     inst_id: str, io_read_data: dict, io_write_data: dict, include_io: bool
 ) -> tuple[float | None, float | None]:
     """Calculate I/O read/write metrics for a process instance."""
-    if not include_io and not io_read_data:
+    if not include_io:
         return None, None
     io_read = float(io_read_data.get(inst_id, 0))
     io_write = float(io_write_data.get(inst_id, 0))
     return io_read, io_write
 
 
+def _round_optional(value: float | None) -> float | None:
+    """Round a metric to one decimal place, passing through missing values."""
+    return None if value is None else round(value, 1)
+
+
 def _build_process_info(
-    inst_id: str, sources: dict[str, dict], sort_by: str, total_mem: float
+    inst_id: str, sources: dict[str, dict], sort_by: str, rss_scale: float
 ) -> ProcessInfo | None:
-    """Build a single ProcessInfo from instance data."""
+    """Build a single ProcessInfo from instance data.
+
+    rss_scale converts RSS bytes to a percentage of total memory.
+    """
     pid = int(sources["pid"].get(inst_id, 0))
     if pid <= 0:
         return None
@@ -219,7 +276,7 @@ def _build_process_info(
     cmd = str(sources["cmd"].get(inst_id, "unknown"))
     cmdline = str(sources["args"].get(inst_id, cmd))[:200]
     rss = int(sources["rss"].get(inst_id, 0)) * 1024
-    rss_pct = (rss / total_mem * 100) if total_mem > 0 else 0.0
+    rss_pct = rss * rss_scale
 
     cpu_pct = _calculate_cpu_percent(inst_id, sources["utime"], sources["stime"], sort_by == "cpu")
 
@@ -227,42 +284,70 @@ def _build_process_info(
         inst_id, sources["io_read"], sources["io_write"], sort_by == "io"
     )
 
-    return ProcessInfo(
+    return ProcessInfo.model_construct(
         pid=pid,
         command=cmd,
         cmdline=cmdline,
-        cpu_percent=round(cpu_pct, 1) if cpu_pct is not None else None,
+        cpu_percent=_round_optional(cpu_pct),
         rss_bytes=rss,
         rss_percent=round(rss_pct, 1),
-        io_read_bytes_per_sec=round(io_read, 1) if io_read is not None else None,
-        io_write_bytes_per_sec=round(io_write, 1) if io_write is not None else None,
+        io_read_bytes_per_sec=_round_optional(io_read),
+        io_write_bytes_per_sec=_round_optional(io_write),
     )
 
 
-def build_process_list(data: dict, sort_by: str, total_mem: float, ncpu: int) -> list[ProcessInfo]:
-    """Build list of ProcessInfo from fetched data."""
+def _raw_cpu_key(sources: dict[str, dict], inst_id: Any) -> float:
+    return float(sources["utime"].get(inst_id, 0)) + float(sources["stime"].get(inst_id, 0))
+
+
+def _raw_memory_key(sources: dict[str, dict], inst_id: Any) -> float:
+    return float(sources["rss"].get(inst_id, 0))
+
+
+def _raw_io_key(sources: dict[str, dict], inst_id: Any) -> float:
+    return float(sources["io_read"].get(inst_id, 0)) + float(sources["io_write"].get(inst_id, 0))
+
+
+def _raw_no_key(sources: dict[str, dict], inst_id: Any) -> float:
+    return 0.0
+
+
+_RAW_SORT_KEYS: dict[str, Callable[[dict[str, dict], Any], float]] = {
+    "cpu": _raw_cpu_key,
+    "memory": _raw_memory_key,
+    "io": _raw_io_key,
+}
+
+
+def _raw_sort_key(sources: dict[str, dict], sort_by: str) -> Callable[[Any], float]:
+    """Get a sort key over instance IDs that reads the raw fetched values."""
+    return partial(_RAW_SORT_KEYS.get(sort_by, _raw_no_key), sources)
+
+
+def build_process_list(
+    data: dict, sort_by: str, total_mem: float, ncpu: int, limit: int | None = None
+) -> list[ProcessInfo]:
+    """Build list of ProcessInfo from fetched data.
+
+    When limit is given, the top processes by sort_by are selected from the raw
+    values first and only those are built, largest first. Otherwise every valid
+    process is returned in fetch order.
+    """
     sources = _extract_process_data_sources(data)
-    processes: list[ProcessInfo] = []
+    inst_ids: list[Any] = [inst_id for inst_id, pid in sources["pid"].items() if int(pid) > 0]
+    if limit is not None:
+        inst_ids = heapq.nlargest(limit, inst_ids, key=_raw_sort_key(sources, sort_by))
 
-    for inst_id in sources["pid"]:
-        process = _build_process_info(inst_id, sources, sort_by, total_mem)
+    rss_scale = 100.0 / total_mem if total_mem > 0 else 0.0
+    processes: list[ProcessInfo] = []
+    for inst_id in inst_ids:
+        process = _build_process_info(inst_id, sources, sort_by, rss_scale)
         if process is not None:
             processes.append(process)
 
     return processes
 
 
-def get_sort_key(proc: ProcessInfo, sort_by: str) -> float:
-    """Get sort key value for a process."""
-    if sort_by == "cpu":
-        return proc.cpu_percent or 0.0
-    elif sort_by == "memory":
-        return float(proc.rss_bytes)
-    elif sort_by == "io":
-        return (proc.io_read_bytes_per_sec or 0.0) + (proc.io_write_bytes_per_sec or 0.0)
-    return 0.0
-
-
 def assess_processes(processes: list[ProcessInfo], sort_by: str, ncpu: int) -> str:
     """Generate assessment string for top processes."""
     if not processes:
@@ -283,14 +368,16 @@ def assess_processes(processes: list[ProcessInfo], sort_by: str, ncpu: int) -> s
 
 def build_tcp_stats(data: dict) -> TCPStats:
     """Build TCP protocol statistics from fetched data."""
-    active_opens = get_first_value(data, "network.tcp.activeopens")
-    passive_opens = get_first_value(data, "network.tcp.passiveopens")
-    attempt_fails = get_first_value(data, "network.tcp.attemptfails")
-    estab_resets = get_first_value(data, "network.tcp.estabresets")
-    current_estab = int(get_first_value(data, "network.tcp.currestab"))
-    retrans = get_first_value(data, "network.tcp.retranssegs")
-    in_errs = get_first_value(data, "network.tcp.inerrs")
-    out_rsts = get_first_value(data, "network.tcp.outrsts")
+    (
+        active_opens,
+        passive_opens,
+        attempt_fails,
+        estab_resets,
+        current_estab,
+        retrans,
+        in_errs,
+        out_rsts,
+    ) = get_first_values(data, _TCP_METRICS)
 
     # Assess TCP health
     if retrans > 100:
@@ -311,7 +398,7 @@ def build_tcp_stats(data: dict) -> TCPStats:
         passive_opens_per_sec=round(passive_opens, 2),
         attempt_fails_per_sec=round(attempt_fails, 2),
         estab_resets_per_sec=round(estab_resets, 2),
-        current_established=current_estab,
+        current_established=int(current_estab),
         retransmits_per_sec=round(retrans, 2),
         in_errors_per_sec=round(in_errs, 2),
         out_resets_per_sec=round(out_rsts, 2),
@@ -321,10 +408,7 @@ def build_tcp_stats(data: dict) -> TCPStats:
 
 def build_udp_stats(data: dict) -> UDPStats:
     """Build UDP protocol statistics from fetched data."""
-    in_dgrams = get_first_value(data, "network.udp.indatagrams")
-    out_dgrams = get_first_value(data, "network.udp.outdatagrams")
-    in_errs = get_first_value(data, "network.udp.inerrors")
-    no_ports = get_first_value(data, "network.udp.noports")
+    in_dgrams, out_dgrams, in_errs, no_ports = get_first_values(data, _UDP_METRICS)
 
     if in_errs > 10:
         assessment = "High UDP receive error rate - possible data loss"
@@ -366,6 +450,11 @@ def build_interface_errors(data: dict) -> list[InterfaceErrors]:
     return results
 
 
+def utc_now_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string for result timestamps."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 __all__ = [
     "build_cpu_metrics",
     "build_memory_metrics",
@@ -376,6 +465,6 @@ __all__ = [
     "build_udp_stats",
     "build_interface_errors",
     "build_process_list",
-    "get_sort_key",
     "assess_processes",
+    "utc_now_iso",
 ]
@@ -5,6 +5,9 @@ Consolidated helpers for extracting values from PCP metric responses.
 
 from __future__ import annotations
 
+import math
+from collections.abc import Iterable
+
 
 def get_first_value(data: dict, metric: str, default: float = 0.0) -> float:
     """Get first instance value from fetched data."""
@@ -15,6 +18,18 @@ def get_first_value(data: dict, metric: str, default: float = 0.0) -> float:
     return default
 
 
+def get_first_values(data: dict, metrics: Iterable[str], default: float = 0.0) -> tuple[float, ...]:
+    """Get the first instance value of each metric, in order.
+
+    Equivalent to calling get_first_value() per metric, in a single loop.
+    """
+    values: list[float] = []
+    for metric in metrics:
+        instances = data.get(metric, {}).get("instances")
+        values.append(float(next(iter(instances.values()))) if instances else default)
+    return tuple(values)
+
+
 def get_scalar_value(response: dict, metric: str, default: int = 0) -> int:
     """Get scalar value from raw fetch response."""
     for v in response.get("values", []):
@@ -29,7 +44,14 @@ def sum_instances(data: dict, metric: str) -> float:
     """Sum all instance values for a metric."""
     metric_data = data.get(metric, {})
     instances = metric_data.get("instances", {})
-    return sum(float(v) for v in instances.values())
+    return math.fsum(instances.values())
+
+
+def sum_instances_each(data: dict, metrics: Iterable[str]) -> tuple[float, ...]:
+    """Sum all instance values for each metric, in order."""
+    return tuple(
+        math.fsum(data.get(metric, {}).get("instances", {}).values()) for metric in metrics
+    )
 
 
 def extract_help_text(metric_dict: dict, default: str = "") -> str:
@@ -46,6 +68,8 @@ def extract_timestamp(response: dict) -> float:
     Handles both float timestamps and dict format {s: ..., us: ...}.
     """
     ts = response.get("timestamp", 0.0)
+    if type(ts) is float:
+        return ts
     if isinstance(ts, dict):
         return ts.get("s", 0) + ts.get("us", 0) / 1e6
     return float(ts)
@@ -70,8 +94,10 @@ def format_units(info: dict) -> str:
 
 __all__ = [
     "get_first_value",
+    "get_first_values",
     "get_scalar_value",
     "sum_instances",
+    "sum_instances_each",
     "extract_help_text",
     "extract_timestamp",
     "format_units",
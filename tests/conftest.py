@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from pcp_mcp.client import PCPClient
 from pcp_mcp.config import PCPMCPSettings
@@ -20,6 +21,14 @@ from pcp_mcp.models import (
     MemoryMetrics,
     SystemSnapshot,
 )
+from pcp_mcp.tools.system import clear_snapshot_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_snapshot_cache() -> None:
+    """Keep cached snapshots from leaking between tests."""
+    clear_snapshot_cache()
+
 
 # =============================================================================
 # Smoke Test Server Fixture - Server without real pmproxy connection
@@ -64,14 +73,14 @@ def smoke_test_server() -> FastMCP:
     return mcp
 
 
-# =============================================================================
-# Metric Data Factories - Use these like to build test data without duplication
 # =============================================================================
 # Metric Data Factories - Use these to build test data without duplication
 # =============================================================================
+# The factories are stateless and build a fresh payload on every call, so they
+# are session-scoped and tests may still mutate what they return.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cpu_metrics_data() -> Callable[..., dict]:
     """Factory for CPU metrics data with configurable values."""
 
@@ -93,7 +102,7 @@ def cpu_metrics_data() -> Callable[..., dict]:
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def memory_metrics_data() -> Callable[..., dict]:
     """Factory for memory metrics data with configurable values."""
 
@@ -119,7 +128,7 @@ def memory_metrics_data() -> Callable[..., dict]:
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_metrics_data() -> Callable[..., dict]:
     """Factory for load metrics data with configurable values."""
 
@@ -141,7 +150,7 @@ def load_metrics_data() -> Callable[..., dict]:
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def disk_metrics_data() -> Callable[..., dict]:
     """Factory for disk metrics data with configurable values."""
 
@@ -161,7 +170,7 @@ def disk_metrics_data() -> Callable[..., dict]:
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def network_metrics_data() -> Callable[..., dict]:
     """Factory for network metrics data with configurable values."""
 
@@ -189,7 +198,7 @@ def network_metrics_data() -> Callable[..., dict]:
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def process_metrics_data() -> Callable[..., dict]:
     """Factory for process metrics data with configurable values."""
 
@@ -208,29 +217,33 @@ def process_metrics_data() -> Callable[..., dict]:
                 {"inst": 2, "pid": 5678, "cmd": "nginx", "args": "nginx -g daemon", "rss": 500_000},
             ]
 
+        pid, cmd, args, rss, utime, stime, io_read, io_write = ({} for _ in range(8))
+        for p in processes:
+            inst = p["inst"]
+            pid[inst] = p["pid"]
+            cmd[inst] = p["cmd"]
+            args[inst] = p["args"]
+            rss[inst] = p["rss"]
+            utime[inst] = p.get("utime", 100.0)
+            stime[inst] = p.get("stime", 50.0)
+            io_read[inst] = p.get("io_read", 1000.0)
+            io_write[inst] = p.get("io_write", 500.0)
+
         return {
-            "proc.psinfo.pid": {"instances": {p["inst"]: p["pid"] for p in processes}},
-            "proc.psinfo.cmd": {"instances": {p["inst"]: p["cmd"] for p in processes}},
-            "proc.psinfo.psargs": {"instances": {p["inst"]: p["args"] for p in processes}},
-            "proc.memory.rss": {"instances": {p["inst"]: p["rss"] for p in processes}},
-            "proc.psinfo.utime": {
-                "instances": {p["inst"]: p.get("utime", 100.0) for p in processes}
-            },
-            "proc.psinfo.stime": {
-                "instances": {p["inst"]: p.get("stime", 50.0) for p in processes}
-            },
-            "proc.io.read_bytes": {
-                "instances": {p["inst"]: p.get("io_read", 1000.0) for p in processes}
-            },
-            "proc.io.write_bytes": {
-                "instances": {p["inst"]: p.get("io_write", 500.0) for p in processes}
-            },
+            "proc.psinfo.pid": {"instances": pid},
+            "proc.psinfo.cmd": {"instances": cmd},
+            "proc.psinfo.psargs": {"instances": args},
+            "proc.memory.rss": {"instances": rss},
+            "proc.psinfo.utime": {"instances": utime},
+            "proc.psinfo.stime": {"instances": stime},
+            "proc.io.read_bytes": {"instances": io_read},
+            "proc.io.write_bytes": {"instances": io_write},
         }
 
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def full_system_snapshot_data(
     cpu_metrics_data,
     memory_metrics_data,
@@ -241,21 +254,19 @@ def full_system_snapshot_data(
     """Factory for full system snapshot data combining all metric types."""
 
     def _make(**overrides) -> dict:
-        data = {}
-        data.update(cpu_metrics_data())
-        data.update(memory_metrics_data())
-        data.update(load_metrics_data())
-        data.update(disk_metrics_data())
-        data.update(network_metrics_data())
-        for key, value in overrides.items():
-            if key in data:
-                data[key] = value
-        return data
+        data = {
+            **cpu_metrics_data(),
+            **memory_metrics_data(),
+            **load_metrics_data(),
+            **disk_metrics_data(),
+            **network_metrics_data(),
+        }
+        return data | {key: overrides[key] for key in overrides.keys() & data.keys()}
 
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def filesystem_metrics_response() -> Callable[..., dict]:
     """Factory for filesystem metrics pmproxy response format."""
 
@@ -284,51 +295,23 @@ def filesystem_metrics_response() -> Callable[..., dict]:
                 },
             ]
 
+        fields = ("mountdir", "capacity", "used", "avail", "full", "type")
+        instances: dict[str, list[dict]] = {field: [] for field in fields}
+        for fs in filesystems:
+            inst = fs["instance"]
+            for field in fields:
+                instances[field].append({"instance": inst, "value": fs[field]})
+
         return {
             "values": [
-                {
-                    "name": "filesys.mountdir",
-                    "instances": [
-                        {"instance": fs["instance"], "value": fs["mountdir"]} for fs in filesystems
-                    ],
-                },
-                {
-                    "name": "filesys.capacity",
-                    "instances": [
-                        {"instance": fs["instance"], "value": fs["capacity"]} for fs in filesystems
-                    ],
-                },
-                {
-                    "name": "filesys.used",
-                    "instances": [
-                        {"instance": fs["instance"], "value": fs["used"]} for fs in filesystems
-                    ],
-                },
-                {
-                    "name": "filesys.avail",
-                    "instances": [
-                        {"instance": fs["instance"], "value": fs["avail"]} for fs in filesystems
-                    ],
-                },
-                {
-                    "name": "filesys.full",
-                    "instances": [
-                        {"instance": fs["instance"], "value": fs["full"]} for fs in filesystems
-                    ],
-                },
-                {
-                    "name": "filesys.type",
-                    "instances": [
-                        {"instance": fs["instance"], "value": fs["type"]} for fs in filesystems
-                    ],
-                },
+                {"name": f"filesys.{field}", "instances": instances[field]} for field in fields
             ]
         }
 
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pmproxy_fetch_response() -> Callable[..., dict]:
     """Factory for pmproxy fetch API response format."""
 
@@ -376,30 +359,27 @@ def mock_lifespan_context(
 @pytest.fixture
 def mock_context(mock_lifespan_context: dict[str, Any]) -> MagicMock:
     """Create a mock MCP Context."""
-    from fastmcp import Context
-
     ctx = MagicMock(spec=Context)
-    ctx.request_context = MagicMock()
-    ctx.request_context.lifespan_context = mock_lifespan_context
+    ctx.request_context = SimpleNamespace(lifespan_context=mock_lifespan_context)
     ctx.report_progress = AsyncMock()
     return ctx
 
 
-@pytest.fixture
+_DEFAULT_NAMESPACES = ("kernel.all.load", "kernel.all.cpu.user", "mem.physmem", "disk.all.read")
+_DEFAULT_PMDAS = (("linux", 0), ("pmcd", 0))
+
+
+@pytest.fixture(scope="session")
 def namespace_search_response() -> Callable[..., list[dict]]:
-    def _make(namespaces: list[str] | None = None) -> list[dict]:
-        if namespaces is None:
-            namespaces = ["kernel.all.load", "kernel.all.cpu.user", "mem.physmem", "disk.all.read"]
+    def _make(namespaces: Sequence[str] = _DEFAULT_NAMESPACES) -> list[dict]:
         return [{"name": ns} for ns in namespaces]
 
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pmda_status_response() -> Callable[..., dict]:
-    def _make(pmdas: list[tuple[str | int, int]] | None = None) -> dict:
-        if pmdas is None:
-            pmdas = [("linux", 0), ("pmcd", 0)]
+    def _make(pmdas: Sequence[tuple[str | int, int]] = _DEFAULT_PMDAS) -> dict:
         return {
             "values": [
                 {
@@ -412,7 +392,7 @@ def pmda_status_response() -> Callable[..., dict]:
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def filesystem_info_factory() -> Callable[..., FilesystemInfo]:
     def _make(
         mount_point: str = "/",
@@ -434,7 +414,10 @@ def filesystem_info_factory() -> Callable[..., FilesystemInfo]:
     return _make
 
 
-@pytest.fixture
+_TOTAL_MEM = 16 * 1024**3
+
+
+@pytest.fixture(scope="session")
 def system_snapshot_factory() -> Callable[..., SystemSnapshot]:
     def _make(
         hostname: str = "testhost",
@@ -443,7 +426,7 @@ def system_snapshot_factory() -> Callable[..., SystemSnapshot]:
         load_1m: float = 1.0,
         ncpu: int = 4,
     ) -> SystemSnapshot:
-        total_mem = 16 * 1024**3
+        free_mem = int(_TOTAL_MEM * (100 - mem_used_percent) / 100)
         return SystemSnapshot(
             timestamp="2025-01-18T12:00:00Z",
             hostname=hostname,
@@ -456,10 +439,10 @@ def system_snapshot_factory() -> Callable[..., SystemSnapshot]:
                 assessment="test",
             ),
             memory=MemoryMetrics(
-                total_bytes=total_mem,
-                used_bytes=int(total_mem * mem_used_percent / 100),
-                free_bytes=int(total_mem * (100 - mem_used_percent) / 100),
-                available_bytes=int(total_mem * (100 - mem_used_percent) / 100),
+                total_bytes=_TOTAL_MEM,
+                used_bytes=int(_TOTAL_MEM * mem_used_percent / 100),
+                free_bytes=free_mem,
+                available_bytes=free_mem,
                 cached_bytes=0,
                 buffers_bytes=0,
                 swap_used_bytes=0,
@@ -3,13 +3,34 @@
 from __future__ import annotations
 
 import os
-from unittest.mock import MagicMock, patch
+from collections.abc import Iterator
+from unittest.mock import MagicMock
 
 import pytest
+from fastmcp import FastMCP
 
 from pcp_mcp import main
 
 
+@pytest.fixture
+def mock_create_server(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace create_server with a mock returning a spec'd FastMCP server."""
+    mock = MagicMock(return_value=MagicMock(spec=FastMCP))
+    monkeypatch.setattr("pcp_mcp.server.create_server", mock)
+    return mock
+
+
+@pytest.fixture
+def unset_target_host(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run with PCP_TARGET_HOST unset and drop whatever main() writes to it."""
+    monkeypatch.delenv("PCP_TARGET_HOST", raising=False)
+    yield
+    # delenv records nothing when the variable was unset; monkeypatch restores
+    # any original value after this teardown.
+    os.environ.pop("PCP_TARGET_HOST", None)
+
+
+@pytest.mark.usefixtures("unset_target_host")
 class TestCLI:
     @pytest.mark.parametrize(
         ("argv", "expected_transport"),
@@ -19,44 +40,34 @@ class TestCLI:
             (["pcp-mcp", "--transport", "streamable-http"], "streamable-http"),
         ],
     )
-    @patch("pcp_mcp.server.create_server")
     def test_main_runs_server_with_transport(
         self,
         mock_create_server: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
         argv: list[str],
         expected_transport: str,
     ) -> None:
-        mock_server = MagicMock()
-        mock_create_server.return_value = mock_server
+        monkeypatch.setattr("sys.argv", argv)
 
-        with patch("sys.argv", argv):
-            main()
+        main()
 
         mock_create_server.assert_called_once()
-        mock_server.run.assert_called_once_with(transport=expected_transport)
-
-    @patch("pcp_mcp.server.create_server")
-    def test_main_sets_target_host_env_var(self, mock_create_server: MagicMock) -> None:
-        mock_server = MagicMock()
-        mock_create_server.return_value = mock_server
-        original_env = os.environ.get("PCP_TARGET_HOST")
-
-        try:
-            with patch("sys.argv", ["pcp-mcp", "--target-host", "remote.example.com"]):
-                main()
-
-            assert os.environ.get("PCP_TARGET_HOST") == "remote.example.com"
-        finally:
-            if original_env is not None:
-                os.environ["PCP_TARGET_HOST"] = original_env
-            elif "PCP_TARGET_HOST" in os.environ:
-                del os.environ["PCP_TARGET_HOST"]
-
-    def test_main_rejects_invalid_transport(self) -> None:
-        with (
-            patch("sys.argv", ["pcp-mcp", "--transport", "invalid"]),
-            pytest.raises(SystemExit) as exc_info,
-        ):
+        mock_create_server.return_value.run.assert_called_once_with(transport=expected_transport)
+        assert "PCP_TARGET_HOST" not in os.environ
+
+    def test_main_sets_target_host_env_var(
+        self, mock_create_server: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("sys.argv", ["pcp-mcp", "--target-host", "remote.example.com"])
+
+        main()
+
+        assert os.environ.get("PCP_TARGET_HOST") == "remote.example.com"
+
+    def test_main_rejects_invalid_transport(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("sys.argv", ["pcp-mcp", "--transport", "invalid"])
+
+        with pytest.raises(SystemExit) as exc_info:
             main()
 
         assert exc_info.value.code == 2
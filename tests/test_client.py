@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 import pytest
 import respx
 from httpx import Response
@@ -9,6 +11,14 @@ from httpx import Response
 from pcp_mcp.client import PCPClient
 
 
+@pytest.fixture
+async def client(respx_mock: respx.MockRouter) -> AsyncIterator[PCPClient]:
+    """Connected PCPClient on pmapi context 1, with requests routed to respx_mock."""
+    respx_mock.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
+    async with PCPClient(base_url="http://localhost:44322") as pcp_client:
+        yield pcp_client
+
+
 class TestPCPClientInit:
     """Tests for PCPClient initialization."""
 
@@ -36,19 +46,17 @@ class TestPCPClientInit:
 class TestPCPClientContextManager:
     """Tests for async context manager protocol."""
 
-    @respx.mock
-    async def test_aenter_creates_context(self) -> None:
+    async def test_aenter_creates_context(self, respx_mock: respx.MockRouter) -> None:
         """Test that __aenter__ creates a pmapi context."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 42}))
+        respx_mock.get("/pmapi/context").mock(return_value=Response(200, json={"context": 42}))
 
         async with PCPClient(base_url="http://localhost:44322") as client:
             assert client.context_id == 42
             assert client._client is not None
 
-    @respx.mock
-    async def test_aexit_closes_client(self) -> None:
+    async def test_aexit_closes_client(self, respx_mock: respx.MockRouter) -> None:
         """Test that __aexit__ closes the httpx client."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 42}))
+        respx_mock.get("/pmapi/context").mock(return_value=Response(200, json={"context": 42}))
 
         client = PCPClient(base_url="http://localhost:44322")
         await client.__aenter__()
@@ -57,23 +65,21 @@ class TestPCPClientContextManager:
         await client.__aexit__(None, None, None)
         assert client._client is None
 
-    @respx.mock
-    async def test_aenter_raises_on_connection_error(self) -> None:
+    async def test_aenter_raises_on_connection_error(self, respx_mock: respx.MockRouter) -> None:
         """Test that connection errors propagate."""
         import httpx
 
-        respx.get("/pmapi/context").mock(side_effect=httpx.ConnectError("Connection refused"))
+        respx_mock.get("/pmapi/context").mock(side_effect=httpx.ConnectError("Connection refused"))
 
         with pytest.raises(httpx.ConnectError):
             async with PCPClient(base_url="http://localhost:44322"):
                 pass
 
-    @respx.mock
-    async def test_aenter_raises_on_http_error(self) -> None:
+    async def test_aenter_raises_on_http_error(self, respx_mock: respx.MockRouter) -> None:
         """Test that HTTP errors propagate."""
         import httpx
 
-        respx.get("/pmapi/context").mock(return_value=Response(500, text="Internal error"))
+        respx_mock.get("/pmapi/context").mock(return_value=Response(500, text="Internal error"))
 
         with pytest.raises(httpx.HTTPStatusError):
             async with PCPClient(base_url="http://localhost:44322"):
@@ -83,11 +89,11 @@ class TestPCPClientContextManager:
 class TestPCPClientFetch:
     """Tests for fetch method."""
 
-    @respx.mock
-    async def test_fetch_single_metric(self) -> None:
+    async def test_fetch_single_metric(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
         """Test fetching a single metric."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/fetch").mock(
+        respx_mock.get("/pmapi/fetch").mock(
             return_value=Response(
                 200,
                 json={
@@ -102,16 +108,15 @@ class TestPCPClientFetch:
             )
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch(["kernel.all.load"])
-            assert "values" in result
-            assert result["values"][0]["name"] == "kernel.all.load"
+        result = await client.fetch(["kernel.all.load"])
+        assert "values" in result
+        assert result["values"][0]["name"] == "kernel.all.load"
 
-    @respx.mock
-    async def test_fetch_multiple_metrics(self) -> None:
+    async def test_fetch_multiple_metrics(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
         """Test fetching multiple metrics."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/fetch").mock(
+        respx_mock.get("/pmapi/fetch").mock(
             return_value=Response(
                 200,
                 json={
@@ -124,9 +129,8 @@ class TestPCPClientFetch:
             )
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch(["hinv.ncpu", "mem.physmem"])
-            assert len(result["values"]) == 2
+        result = await client.fetch(["hinv.ncpu", "mem.physmem"])
+        assert len(result["values"]) == 2
 
     @pytest.mark.parametrize(
         ("method_name", "args"),
@@ -151,11 +155,11 @@ class TestPCPClientFetch:
 class TestPCPClientSearch:
     """Tests for search method."""
 
-    @respx.mock
-    async def test_search_returns_metrics(self) -> None:
+    async def test_search_returns_metrics(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
         """Test searching for metrics by prefix."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/metric").mock(
+        respx_mock.get("/pmapi/metric").mock(
             return_value=Response(
                 200,
                 json={
@@ -167,30 +171,28 @@ class TestPCPClientSearch:
             )
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.search("kernel.all")
-            assert len(result) == 2
-            assert result[0]["name"] == "kernel.all.load"
+        result = await client.search("kernel.all")
+        assert len(result) == 2
+        assert result[0]["name"] == "kernel.all.load"
 
-    @respx.mock
-    async def test_search_empty_result(self) -> None:
+    async def test_search_empty_result(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
         """Test searching for non-existent metrics."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/metric").mock(return_value=Response(200, json={"metrics": []}))
+        respx_mock.get("/pmapi/metric").mock(return_value=Response(200, json={"metrics": []}))
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.search("nonexistent.metric")
-            assert result == []
+        result = await client.search("nonexistent.metric")
+        assert result == []
 
 
 class TestPCPClientDescribe:
     """Tests for describe method."""
 
-    @respx.mock
-    async def test_describe_returns_metadata(self) -> None:
+    async def test_describe_returns_metadata(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
         """Test describing a metric returns metadata."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/metric").mock(
+        respx_mock.get("/pmapi/metric").mock(
             return_value=Response(
                 200,
                 json={
@@ -206,20 +208,18 @@ class TestPCPClientDescribe:
             )
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.describe("kernel.all.load")
-            assert result["name"] == "kernel.all.load"
-            assert result["sem"] == "instant"
+        result = await client.describe("kernel.all.load")
+        assert result["name"] == "kernel.all.load"
+        assert result["sem"] == "instant"
 
-    @respx.mock
-    async def test_describe_returns_empty_for_unknown(self) -> None:
+    async def test_describe_returns_empty_for_unknown(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
         """Test describing unknown metric returns empty dict."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/metric").mock(return_value=Response(200, json={"metrics": []}))
+        respx_mock.get("/pmapi/metric").mock(return_value=Response(200, json={"metrics": []}))
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.describe("nonexistent.metric")
-            assert result == {}
+        result = await client.describe("nonexistent.metric")
+        assert result == {}
 
 
 class TestPCPClientContextRecreation:
@@ -263,9 +263,9 @@ class TestPCPClientContextRecreation:
             ),
         ],
     )
-    @respx.mock
     async def test_recreates_context_on_expiration(
         self,
+        respx_mock: respx.MockRouter,
         method_name: str,
         args: tuple,
         endpoint: str,
@@ -274,13 +274,13 @@ class TestPCPClientContextRecreation:
         verify,
     ) -> None:
         """Test that methods recreate context when it expires."""
-        respx.get("/pmapi/context").mock(
+        respx_mock.get("/pmapi/context").mock(
             side_effect=[
                 Response(200, json={"context": 1}),
                 Response(200, json={"context": 2}),
             ]
         )
-        respx.get(endpoint).mock(side_effect=[expired_response, success_response])
+        respx_mock.get(endpoint).mock(side_effect=[expired_response, success_response])
 
         async with PCPClient(base_url="http://localhost:44322") as client:
             assert client.context_id == 1
@@ -289,295 +289,126 @@ class TestPCPClientContextRecreation:
             assert client.context_id == 2
             assert verify(result)
 
-    @respx.mock
-    async def test_does_not_recreate_on_other_400_errors(self) -> None:
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/fetch").mock(
+    async def test_does_not_recreate_on_other_400_errors(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
+        respx_mock.get("/pmapi/fetch").mock(
             return_value=Response(400, json={"message": "invalid metric name"})
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            resp = await client._request_with_retry(
-                "GET", url="/pmapi/fetch", params={"context": 1, "names": "bad.metric"}
-            )
-            assert resp.status_code == 400
+        resp = await client._request_with_retry(
+            "GET", url="/pmapi/fetch", params={"context": 1, "names": "bad.metric"}
+        )
+        assert resp.status_code == 400
 
 
 class TestPCPClientFetchWithRates:
     """Tests for fetch_with_rates method."""
 
-    @respx.mock
-    async def test_fetch_with_rates_calculates_rate_for_counters(self) -> None:
-        """Test that counter metrics are converted to rates."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-
-        respx.get("/pmapi/fetch").mock(
-            side_effect=[
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1000, "us": 0},
-                        "values": [
-                            {
-                                "name": "disk.all.read_bytes",
-                                "instances": [{"instance": -1, "value": 1000000}],
-                            }
-                        ],
-                    },
-                ),
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1001, "us": 0},
-                        "values": [
-                            {
-                                "name": "disk.all.read_bytes",
-                                "instances": [{"instance": -1, "value": 1100000}],
-                            }
-                        ],
-                    },
-                ),
-            ]
-        )
-
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["disk.all.read_bytes"],
-                counter_metrics={"disk.all.read_bytes"},
-                sample_interval=0.01,
-            )
-
-            assert "disk.all.read_bytes" in result
-            assert result["disk.all.read_bytes"]["is_rate"] is True
-            assert result["disk.all.read_bytes"]["instances"][-1] == pytest.approx(100000.0)
-
-    @respx.mock
-    async def test_fetch_with_rates_returns_instant_for_gauges(self) -> None:
-        """Test that gauge metrics return instant values."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-
-        respx.get("/pmapi/fetch").mock(
-            side_effect=[
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1000, "us": 0},
-                        "values": [
-                            {
-                                "name": "mem.util.used",
-                                "instances": [{"instance": -1, "value": 8000000}],
-                            }
-                        ],
-                    },
-                ),
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1001, "us": 0},
-                        "values": [
-                            {
-                                "name": "mem.util.used",
-                                "instances": [{"instance": -1, "value": 8500000}],
-                            }
-                        ],
-                    },
-                ),
-            ]
-        )
-
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["mem.util.used"],
-                counter_metrics=set(),
-                sample_interval=0.01,
-            )
-
-            assert "mem.util.used" in result
-            assert result["mem.util.used"]["is_rate"] is False
-            assert result["mem.util.used"]["instances"][-1] == 8500000
-
-    @respx.mock
-    async def test_fetch_with_rates_handles_counter_wraparound(self) -> None:
-        """Test that counter wraparound is handled gracefully."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-
-        respx.get("/pmapi/fetch").mock(
-            side_effect=[
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1000, "us": 0},
-                        "values": [
-                            {
-                                "name": "network.interface.in.bytes",
-                                "instances": [{"instance": 0, "value": 4294967290}],
-                            }
-                        ],
-                    },
-                ),
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1001, "us": 0},
-                        "values": [
-                            {
-                                "name": "network.interface.in.bytes",
-                                "instances": [{"instance": 0, "value": 100}],
-                            }
-                        ],
-                    },
-                ),
-            ]
-        )
-
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["network.interface.in.bytes"],
-                counter_metrics={"network.interface.in.bytes"},
-                sample_interval=0.01,
-            )
-
-            assert result["network.interface.in.bytes"]["instances"][0] == pytest.approx(100.0)
-
-    @respx.mock
-    async def test_fetch_with_rates_multiple_instances(self) -> None:
-        """Test rate calculation with multiple instances (per-CPU, per-disk)."""
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-
-        respx.get("/pmapi/fetch").mock(
+    @pytest.mark.parametrize(
+        ("metric", "timestamps", "samples", "is_counter", "sample_interval", "expected"),
+        [
+            pytest.param(
+                "disk.all.read_bytes",
+                ({"s": 1000, "us": 0}, {"s": 1001, "us": 0}),
+                ({-1: 1000000}, {-1: 1100000}),
+                True,
+                0.01,
+                {-1: 100000.0},
+                id="counter",
+            ),
+            pytest.param(
+                "mem.util.used",
+                ({"s": 1000, "us": 0}, {"s": 1001, "us": 0}),
+                ({-1: 8000000}, {-1: 8500000}),
+                False,
+                0.01,
+                {-1: 8500000},
+                id="gauge",
+            ),
+            pytest.param(
+                "network.interface.in.bytes",
+                ({"s": 1000, "us": 0}, {"s": 1001, "us": 0}),
+                ({0: 4294967290}, {0: 100}),
+                True,
+                0.01,
+                {0: 100.0},
+                id="wraparound",
+            ),
+            pytest.param(
+                "kernel.percpu.cpu.user",
+                ({"s": 1000, "us": 0}, {"s": 1001, "us": 0}),
+                ({0: 1000, 1: 2000}, {0: 1100, 1: 2300}),
+                True,
+                0.01,
+                {0: 100.0, 1: 300.0},
+                id="multiple_instances",
+            ),
+            pytest.param(
+                "disk.all.read_bytes",
+                (1000.0, 1001.5),
+                ({-1: 1000000}, {-1: 1150000}),
+                True,
+                0.01,
+                {-1: 100000.0},
+                id="float_timestamps",
+            ),
+            pytest.param(
+                "disk.all.read_bytes",
+                (0.0, 0.0),
+                ({-1: 1000000}, {-1: 1100000}),
+                True,
+                1.0,
+                {-1: 100000.0},
+                id="invalid_timestamps_use_sample_interval",
+            ),
+        ],
+    )
+    async def test_fetch_with_rates(
+        self,
+        client: PCPClient,
+        respx_mock: respx.MockRouter,
+        metric: str,
+        timestamps: tuple[float | dict, float | dict],
+        samples: tuple[dict[int, int], dict[int, int]],
+        is_counter: bool,
+        sample_interval: float,
+        expected: dict[int, float],
+    ) -> None:
+        respx_mock.get("/pmapi/fetch").mock(
             side_effect=[
                 Response(
                     200,
                     json={
-                        "timestamp": {"s": 1000, "us": 0},
+                        "timestamp": timestamp,
                         "values": [
                             {
-                                "name": "kernel.percpu.cpu.user",
+                                "name": metric,
                                 "instances": [
-                                    {"instance": 0, "value": 1000},
-                                    {"instance": 1, "value": 2000},
+                                    {"instance": inst, "value": value}
+                                    for inst, value in sample.items()
                                 ],
                             }
                         ],
                     },
-                ),
-                Response(
-                    200,
-                    json={
-                        "timestamp": {"s": 1001, "us": 0},
-                        "values": [
-                            {
-                                "name": "kernel.percpu.cpu.user",
-                                "instances": [
-                                    {"instance": 0, "value": 1100},
-                                    {"instance": 1, "value": 2300},
-                                ],
-                            }
-                        ],
-                    },
-                ),
+                )
+                for timestamp, sample in zip(timestamps, samples, strict=True)
             ]
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["kernel.percpu.cpu.user"],
-                counter_metrics={"kernel.percpu.cpu.user"},
-                sample_interval=0.01,
-            )
-
-            instances = result["kernel.percpu.cpu.user"]["instances"]
-            assert instances[0] == pytest.approx(100.0)
-            assert instances[1] == pytest.approx(300.0)
-
-    @respx.mock
-    async def test_fetch_with_rates_handles_float_timestamps(self) -> None:
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-
-        respx.get("/pmapi/fetch").mock(
-            side_effect=[
-                Response(
-                    200,
-                    json={
-                        "timestamp": 1000.0,
-                        "values": [
-                            {
-                                "name": "disk.all.read_bytes",
-                                "instances": [{"instance": -1, "value": 1000000}],
-                            }
-                        ],
-                    },
-                ),
-                Response(
-                    200,
-                    json={
-                        "timestamp": 1001.5,
-                        "values": [
-                            {
-                                "name": "disk.all.read_bytes",
-                                "instances": [{"instance": -1, "value": 1150000}],
-                            }
-                        ],
-                    },
-                ),
-            ]
-        )
-
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["disk.all.read_bytes"],
-                counter_metrics={"disk.all.read_bytes"},
-                sample_interval=0.01,
-            )
-
-            assert result["disk.all.read_bytes"]["instances"][-1] == pytest.approx(100000.0)
-
-    @respx.mock
-    async def test_fetch_with_rates_uses_sample_interval_when_timestamps_invalid(self) -> None:
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-
-        respx.get("/pmapi/fetch").mock(
-            side_effect=[
-                Response(
-                    200,
-                    json={
-                        "timestamp": 0.0,
-                        "values": [
-                            {
-                                "name": "disk.all.read_bytes",
-                                "instances": [{"instance": -1, "value": 1000000}],
-                            }
-                        ],
-                    },
-                ),
-                Response(
-                    200,
-                    json={
-                        "timestamp": 0.0,
-                        "values": [
-                            {
-                                "name": "disk.all.read_bytes",
-                                "instances": [{"instance": -1, "value": 1100000}],
-                            }
-                        ],
-                    },
-                ),
-            ]
+        result = await client.fetch_with_rates(
+            metric_names=[metric],
+            counter_metrics={metric} if is_counter else set(),
+            sample_interval=sample_interval,
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["disk.all.read_bytes"],
-                counter_metrics={"disk.all.read_bytes"},
-                sample_interval=1.0,
-            )
-
-            assert result["disk.all.read_bytes"]["instances"][-1] == pytest.approx(100000.0)
+        assert result[metric]["is_rate"] is is_counter
+        assert result[metric]["instances"] == pytest.approx(expected)
 
-    @respx.mock
-    async def test_fetch_with_rates_calls_progress_callback(self) -> None:
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/fetch").mock(
+    async def test_fetch_with_rates_calls_progress_callback(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
+        respx_mock.get("/pmapi/fetch").mock(
             side_effect=[
                 Response(
                     200,
@@ -605,13 +436,12 @@ class TestPCPClientFetchWithRates:
         async def track_progress(current: float, total: float, message: str) -> None:
             progress_calls.append((current, total, message))
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            await client.fetch_with_rates(
-                metric_names=["hinv.ncpu"],
-                counter_metrics=set(),
-                sample_interval=0.01,
-                progress_callback=track_progress,
-            )
+        await client.fetch_with_rates(
+            metric_names=["hinv.ncpu"],
+            counter_metrics=set(),
+            sample_interval=0.01,
+            progress_callback=track_progress,
+        )
 
         assert len(progress_calls) == 4
         assert progress_calls[0][0] == 0
@@ -619,10 +449,10 @@ class TestPCPClientFetchWithRates:
         assert "first sample" in progress_calls[0][2].lower()
         assert "rate" in progress_calls[1][2].lower()
 
-    @respx.mock
-    async def test_fetch_with_rates_works_without_progress_callback(self) -> None:
-        respx.get("/pmapi/context").mock(return_value=Response(200, json={"context": 1}))
-        respx.get("/pmapi/fetch").mock(
+    async def test_fetch_with_rates_works_without_progress_callback(
+        self, client: PCPClient, respx_mock: respx.MockRouter
+    ) -> None:
+        respx_mock.get("/pmapi/fetch").mock(
             return_value=Response(
                 200,
                 json={
@@ -632,11 +462,10 @@ class TestPCPClientFetchWithRates:
             )
         )
 
-        async with PCPClient(base_url="http://localhost:44322") as client:
-            result = await client.fetch_with_rates(
-                metric_names=["hinv.ncpu"],
-                counter_metrics=set(),
-                sample_interval=0.01,
-            )
+        result = await client.fetch_with_rates(
+            metric_names=["hinv.ncpu"],
+            counter_metrics=set(),
+            sample_interval=0.01,
+        )
 
         assert "hinv.ncpu" in result
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from pcp_mcp.config import PCPMCPSettings
 
@@ -18,6 +19,13 @@ def test_default_settings() -> None:
     assert settings.timeout == 30.0
     assert settings.username is None
     assert settings.password is None
+    assert settings.snapshot_ttl == 2.0
+
+
+@pytest.mark.parametrize("snapshot_ttl", [-1.0, 61.0])
+def test_rejects_out_of_range_snapshot_ttl(snapshot_ttl: float) -> None:
+    with pytest.raises(ValidationError, match="snapshot_ttl"):
+        PCPMCPSettings(snapshot_ttl=snapshot_ttl)
 
 
 def test_computed_fields_in_model_dump() -> None:
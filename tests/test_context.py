@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
-from pcp_mcp.context import get_client, get_client_for_host, get_settings
+from pcp_mcp.client import PCPClient
+from pcp_mcp.config import PCPMCPSettings
+from pcp_mcp.context import HostClientPool, get_client, get_client_for_host, get_settings
+
+
+def _pooled_client_factory() -> MagicMock:
+    """Patchable PCPClient constructor returning a fresh spec'd mock per host."""
+
+    def _make(**kwargs) -> AsyncMock:
+        client = AsyncMock(spec=PCPClient)
+        client.target_host = kwargs["target_host"]
+        return client
+
+    return MagicMock(side_effect=_make)
 
 
 class TestGetClient:
@@ -25,8 +41,7 @@ class TestGetClient:
 
     def test_raises_tool_error_when_lifespan_context_is_none(self) -> None:
         ctx = MagicMock(spec=Context)
-        ctx.request_context = MagicMock()
-        ctx.request_context.lifespan_context = None
+        ctx.request_context = SimpleNamespace(lifespan_context=None)
 
         with pytest.raises(ToolError, match="Server context not available"):
             get_client(ctx)
@@ -46,8 +61,7 @@ class TestGetSettings:
 
     def test_raises_tool_error_when_lifespan_context_is_none(self) -> None:
         ctx = MagicMock(spec=Context)
-        ctx.request_context = MagicMock()
-        ctx.request_context.lifespan_context = None
+        ctx.request_context = SimpleNamespace(lifespan_context=None)
 
         with pytest.raises(ToolError, match="Server context not available"):
             get_settings(ctx)
@@ -139,3 +153,187 @@ class TestGetClientForHost:
 
             async with get_client_for_host(mock_context, host=query_host) as client:
                 assert client is mock_client_instance
+
+    async def test_borrows_client_from_pool_when_configured(self, mock_context: MagicMock) -> None:
+        lifespan_context = mock_context.request_context.lifespan_context
+        lifespan_context["settings"].allowed_hosts = ["remote.example.com"]
+        lifespan_context["host_clients"] = HostClientPool(lifespan_context["settings"])
+
+        with patch("pcp_mcp.context.PCPClient", _pooled_client_factory()) as mock_pcp_client:
+            async with get_client_for_host(mock_context, host="remote.example.com") as first:
+                pass
+            async with get_client_for_host(mock_context, host="remote.example.com") as second:
+                pass
+
+        assert first is second
+        mock_pcp_client.assert_called_once()
+        first.__aexit__.assert_not_called()
+
+
+class TestHostClientPool:
+    @pytest.fixture
+    def pool(self, mock_settings: PCPMCPSettings) -> HostClientPool:
+        return HostClientPool(mock_settings, idle_timeout=60.0)
+
+    async def test_reuses_client_for_same_host(self, pool: HostClientPool) -> None:
+        with patch("pcp_mcp.context.PCPClient", _pooled_client_factory()) as mock_pcp_client:
+            async with pool.acquire("a.example.com") as first:
+                pass
+            async with pool.acquire("a.example.com") as second:
+                pass
+
+        assert first is second
+        mock_pcp_client.assert_called_once()
+        first.__aenter__.assert_awaited_once()
+        first.__aexit__.assert_not_called()
+
+    async def test_keeps_one_client_per_host(self, pool: HostClientPool) -> None:
+        with patch("pcp_mcp.context.PCPClient", _pooled_client_factory()):
+            async with (
+                pool.acquire("a.example.com") as first,
+                pool.acquire("b.example.com") as second,
+            ):
+                assert first.target_host == "a.example.com"
+                assert second.target_host == "b.example.com"
+
+        assert len(pool) == 2
+
+    async def test_closes_idle_clients(self, pool: HostClientPool) -> None:
+        with (
+            patch("pcp_mcp.context.PCPClient", _pooled_client_factory()),
+            patch("pcp_mcp.context.time", spec=time) as mock_time,
+        ):
+            mock_time.monotonic.return_value = 0.0
+            async with pool.acquire("a.example.com") as idle_client:
+                pass
+
+            mock_time.monotonic.return_value = 61.0
+            async with pool.acquire("b.example.com"):
+                pass
+
+        idle_client.__aexit__.assert_awaited_once()
+        assert len(pool) == 1
+
+    async def test_keeps_in_use_clients_open(self, pool: HostClientPool) -> None:
+        with (
+            patch("pcp_mcp.context.PCPClient", _pooled_client_factory()),
+            patch("pcp_mcp.context.time", spec=time) as mock_time,
+        ):
+            mock_time.monotonic.return_value = 0.0
+            async with pool.acquire("a.example.com") as busy_client:
+                mock_time.monotonic.return_value = 61.0
+                async with pool.acquire("b.example.com"):
+                    pass
+
+        busy_client.__aexit__.assert_not_called()
+        assert len(pool) == 2
+
+    async def test_failed_connect_is_not_pooled(self, pool: HostClientPool) -> None:
+        failing = AsyncMock(spec=PCPClient)
+        failing.__aenter__.side_effect = ConnectionError("Connection refused")
+
+        with (
+            patch("pcp_mcp.context.PCPClient", return_value=failing),
+            pytest.raises(ConnectionError, match="Connection refused"),
+        ):
+            async with pool.acquire("a.example.com"):
+                pass
+
+        failing.__aexit__.assert_awaited_once()
+        assert len(pool) == 0
+
+    async def test_slow_connect_does_not_block_other_hosts(self, pool: HostClientPool) -> None:
+        release = asyncio.Event()
+        factory = _pooled_client_factory()
+
+        def _make(**kwargs) -> AsyncMock:
+            client = factory(**kwargs)
+            if kwargs["target_host"] == "slow.example.com":
+                client.__aenter__.side_effect = release.wait
+            return client
+
+        with patch("pcp_mcp.context.PCPClient", side_effect=_make):
+            slow = asyncio.ensure_future(self._borrow(pool, "slow.example.com"))
+            await asyncio.sleep(0)
+
+            async with pool.acquire("fast.example.com") as fast_client:
+                assert fast_client.target_host == "fast.example.com"
+            assert not slow.done()
+
+            release.set()
+            assert await slow == "slow.example.com"
+
+    async def test_concurrent_acquires_share_one_connect(self, pool: HostClientPool) -> None:
+        with patch("pcp_mcp.context.PCPClient", _pooled_client_factory()) as mock_pcp_client:
+            hosts = await asyncio.gather(
+                self._borrow(pool, "a.example.com"), self._borrow(pool, "a.example.com")
+            )
+
+        assert hosts == ["a.example.com", "a.example.com"]
+        mock_pcp_client.assert_called_once()
+
+    async def test_closing_idle_client_does_not_block_other_hosts(
+        self, pool: HostClientPool
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_close(*args) -> None:
+            await release.wait()
+
+        with (
+            patch("pcp_mcp.context.PCPClient", _pooled_client_factory()),
+            patch("pcp_mcp.context.time", spec=time) as mock_time,
+        ):
+            mock_time.monotonic.return_value = 0.0
+            async with pool.acquire("idle.example.com") as idle_client:
+                idle_client.__aexit__.side_effect = slow_close
+
+            mock_time.monotonic.return_value = 61.0
+            reaping = asyncio.ensure_future(self._borrow(pool, "a.example.com"))
+            await asyncio.sleep(0)
+
+            async with pool.acquire("b.example.com") as other:
+                assert other.target_host == "b.example.com"
+            assert not reaping.done()
+
+            release.set()
+            assert await reaping == "a.example.com"
+
+    async def test_aclose_aborts_pending_connects(self, pool: HostClientPool) -> None:
+        connecting = asyncio.Event()
+
+        async def hang() -> None:
+            connecting.set()
+            await asyncio.Event().wait()
+
+        pending = AsyncMock(spec=PCPClient)
+        pending.__aenter__.side_effect = hang
+
+        with patch("pcp_mcp.context.PCPClient", return_value=pending):
+            borrow = asyncio.ensure_future(self._borrow(pool, "a.example.com"))
+            await connecting.wait()
+            await pool.aclose()
+
+            with pytest.raises(asyncio.CancelledError):
+                await borrow
+
+        pending.__aexit__.assert_awaited_once()
+        assert len(pool) == 0
+
+    @staticmethod
+    async def _borrow(pool: HostClientPool, host: str) -> str:
+        async with pool.acquire(host) as client:
+            return client.target_host
+
+    async def test_aclose_closes_all_clients(self, pool: HostClientPool) -> None:
+        with patch("pcp_mcp.context.PCPClient", _pooled_client_factory()):
+            async with pool.acquire("a.example.com") as first:
+                pass
+            async with pool.acquire("b.example.com") as second:
+                pass
+
+        await pool.aclose()
+
+        first.__aexit__.assert_awaited_once()
+        second.__aexit__.assert_awaited_once()
+        assert len(pool) == 0
@@ -0,0 +1,21 @@
+"""Tests for the shared ToolResult builder."""
+
+from __future__ import annotations
+
+import json
+
+from mcp.types import TextContent
+
+from pcp_mcp.tools._result import build_tool_result
+from pcp_mcp.utils.builders import build_cpu_metrics
+
+
+class TestBuildToolResult:
+    def test_carries_json_and_structured_content(self, cpu_metrics_data) -> None:
+        metrics = build_cpu_metrics(cpu_metrics_data())
+        result = build_tool_result(metrics)
+
+        assert result.structured_content == metrics.model_dump()
+        text = result.content[0]
+        assert isinstance(text, TextContent)
+        assert json.loads(text.text) == metrics.model_dump()
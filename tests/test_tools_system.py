@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, call
 
 import httpx
 import pytest
+from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from pcp_mcp.client import PCPClient
+from pcp_mcp.context import HostClientPool
 from pcp_mcp.models import DiagnosisResult
 from pcp_mcp.tools.system import (
     _assess_filesystems,
     _build_fallback_diagnosis,
     _build_filesystem_list,
+    _fetch_system_snapshot,
     _format_snapshot_for_llm,
+    clear_snapshot_cache,
     get_filesystem_usage,
     get_process_top,
     get_system_snapshot,
@@ -34,6 +42,27 @@ def system_tools() -> dict:
     }
 
 
+REMOTE_HOST = "remote.example.com"
+
+
+@pytest.fixture
+def remote_client(mock_context: MagicMock) -> AsyncMock:
+    """Pooled client for an allowed host other than the configured target."""
+    client = AsyncMock(spec=PCPClient)
+    client.target_host = REMOTE_HOST
+
+    @asynccontextmanager
+    async def acquire(host: str) -> AsyncIterator[AsyncMock]:
+        yield client
+
+    pool = MagicMock(spec=HostClientPool)
+    pool.acquire.side_effect = acquire
+    lifespan_context = mock_context.request_context.lifespan_context
+    lifespan_context["settings"].allowed_hosts = [REMOTE_HOST]
+    lifespan_context["host_clients"] = pool
+    return client
+
+
 class TestToolErrorHandling:
     @pytest.mark.parametrize(
         ("tool_name", "client_method", "tool_kwargs"),
@@ -138,6 +167,230 @@ class TestGetSystemSnapshot:
         calls = mock_context.report_progress.call_args_list
         assert calls[-1] == call(100, 100, "Complete")
 
+    async def test_fetches_shared_metrics_once(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await system_tools["get_system_snapshot"](mock_context, categories=["cpu", "load"])
+
+        fetched_metrics = client.fetch_with_rates.call_args[0][0]
+        assert fetched_metrics.count("hinv.ncpu") == 1
+        assert "kernel.all.load" in fetched_metrics
+
+    async def test_reuses_recent_snapshot(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        first = await system_tools["get_system_snapshot"](mock_context)
+        second = await system_tools["get_system_snapshot"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 1
+        assert second.structured_content == first.structured_content
+
+    async def test_reports_completion_on_cache_hit(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await system_tools["get_system_snapshot"](mock_context)
+        mock_context.report_progress.reset_mock()
+        await system_tools["get_system_snapshot"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 1
+        mock_context.report_progress.assert_awaited_once_with(100, 100, "Complete")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"categories": ["cpu"]},
+            {"sample_interval": 2.0},
+        ],
+    )
+    async def test_refetches_for_different_arguments(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+        kwargs: dict,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await system_tools["get_system_snapshot"](mock_context)
+        await system_tools["get_system_snapshot"](mock_context, **kwargs)
+
+        assert client.fetch_with_rates.call_count == 2
+
+    async def test_refetches_for_other_host(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+        remote_client: AsyncMock,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+        remote_client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await system_tools["get_system_snapshot"](mock_context)
+        result = await system_tools["get_system_snapshot"](mock_context, host=REMOTE_HOST)
+
+        assert client.fetch_with_rates.call_count == 1
+        assert remote_client.fetch_with_rates.call_count == 1
+        assert result.structured_content["hostname"] == REMOTE_HOST
+
+    async def test_default_and_explicit_target_host_share_cache(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        lifespan_context = mock_context.request_context.lifespan_context
+        lifespan_context["client"].fetch_with_rates.return_value = full_system_snapshot_data()
+        target_host = lifespan_context["settings"].target_host
+
+        await system_tools["get_system_snapshot"](mock_context)
+        await system_tools["get_system_snapshot"](mock_context, host=target_host)
+
+        assert lifespan_context["client"].fetch_with_rates.call_count == 1
+
+    async def test_refetches_when_ttl_disabled(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        lifespan_context = mock_context.request_context.lifespan_context
+        lifespan_context["settings"].snapshot_ttl = 0.0
+        lifespan_context["client"].fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await system_tools["get_system_snapshot"](mock_context)
+        await system_tools["get_system_snapshot"](mock_context)
+
+        assert lifespan_context["client"].fetch_with_rates.call_count == 2
+
+    async def test_coalesces_concurrent_requests(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_fetch(*args, **kwargs) -> dict:
+            await release.wait()
+            return full_system_snapshot_data()
+
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.side_effect = slow_fetch
+
+        calls = asyncio.gather(
+            system_tools["get_system_snapshot"](mock_context),
+            system_tools["get_system_snapshot"](mock_context),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        first, second = await calls
+
+        assert client.fetch_with_rates.call_count == 1
+        assert second.structured_content == first.structured_content
+
+    async def test_coalesced_waiters_each_get_progress(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_fetch(*args, progress_callback, **kwargs) -> dict:
+            await release.wait()
+            await progress_callback(90, 100, "Sampled")
+            return full_system_snapshot_data()
+
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.side_effect = slow_fetch
+        failing_context = MagicMock(spec=Context)
+        failing_context.request_context = mock_context.request_context
+        failing_context.report_progress = AsyncMock(side_effect=RuntimeError("client gone"))
+
+        calls = asyncio.gather(
+            system_tools["get_system_snapshot"](failing_context),
+            system_tools["get_system_snapshot"](mock_context),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0)
+        release.set()
+        failed, result = await calls
+
+        assert isinstance(failed, RuntimeError)
+        assert result.structured_content["hostname"] == "localhost"
+        assert mock_context.report_progress.call_args_list == [
+            call(90, 100, "Sampled"),
+            call(95, 100, "Building snapshot..."),
+            call(100, 100, "Complete"),
+        ]
+
+    async def test_cancelled_waiter_does_not_fail_others(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_fetch(*args, **kwargs) -> dict:
+            await release.wait()
+            return full_system_snapshot_data()
+
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.side_effect = slow_fetch
+        cancelled_context = MagicMock(spec=Context)
+        cancelled_context.request_context = mock_context.request_context
+        cancelled_context.report_progress = AsyncMock()
+
+        first = asyncio.ensure_future(system_tools["get_system_snapshot"](cancelled_context))
+        second = asyncio.ensure_future(system_tools["get_system_snapshot"](mock_context))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await second
+
+        assert first.cancelled()
+        assert result.structured_content["hostname"] == "localhost"
+        cancelled_context.report_progress.assert_not_called()
+        assert mock_context.report_progress.call_args_list[-1] == call(100, 100, "Complete")
+
+    async def test_refetches_after_cache_cleared(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await system_tools["get_system_snapshot"](mock_context)
+        clear_snapshot_cache()
+        await system_tools["get_system_snapshot"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 2
+
 
 class TestQuickHealth:
     async def test_returns_only_cpu_and_memory(
@@ -185,12 +438,10 @@ class TestQuickHealth:
 
 class TestGetProcessTop:
     @pytest.fixture
-    def system_info_response(self) -> dict:
+    def system_info_data(self) -> dict:
         return {
-            "values": [
-                {"name": "hinv.ncpu", "instances": [{"value": 4}]},
-                {"name": "mem.physmem", "instances": [{"value": 16000000}]},
-            ]
+            "hinv.ncpu": {"instances": {-1: 4}},
+            "mem.physmem": {"instances": {-1: 16_000_000}},
         }
 
     @pytest.mark.parametrize(
@@ -206,16 +457,14 @@ class TestGetProcessTop:
         mock_context: MagicMock,
         system_tools: dict,
         process_metrics_data,
-        system_info_response: dict,
+        system_info_data: dict,
         sort_by: str,
         expected_field: str,
     ) -> None:
-        mock_context.request_context.lifespan_context[
-            "client"
-        ].fetch_with_rates.return_value = process_metrics_data()
-        mock_context.request_context.lifespan_context[
-            "client"
-        ].fetch.return_value = system_info_response
+        mock_context.request_context.lifespan_context["client"].fetch_with_rates.return_value = {
+            **process_metrics_data(),
+            **system_info_data,
+        }
 
         tools = system_tools
         result = await tools["get_process_top"](mock_context, sort_by=sort_by, limit=2)
@@ -223,22 +472,40 @@ class TestGetProcessTop:
         assert len(result.structured_content["processes"]) == 2
         assert result.structured_content["sort_by"] == sort_by
         assert result.structured_content["ncpu"] == 4
+        assert result.structured_content["total_memory_bytes"] == 16_000_000 * 1024
         assert result.structured_content["processes"][0][expected_field] is not None
 
+    async def test_returns_largest_processes_first(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        process_metrics_data,
+        system_info_data: dict,
+    ) -> None:
+        processes = [
+            {"inst": i, "pid": 1000 + i, "cmd": f"proc{i}", "args": "", "rss": rss}
+            for i, rss in enumerate([300, 100, 500, 200, 400], start=1)
+        ]
+        mock_context.request_context.lifespan_context["client"].fetch_with_rates.return_value = {
+            **process_metrics_data(processes=processes),
+            **system_info_data,
+        }
+
+        result = await system_tools["get_process_top"](mock_context, sort_by="memory", limit=3)
+
+        commands = [p["command"] for p in result.structured_content["processes"]]
+        assert commands == ["proc3", "proc5", "proc1"]
+
     async def test_reports_progress(
         self,
         mock_context: MagicMock,
         system_tools: dict,
         process_metrics_data,
+        system_info_data: dict,
     ) -> None:
-        mock_context.request_context.lifespan_context[
-            "client"
-        ].fetch_with_rates.return_value = process_metrics_data()
-        mock_context.request_context.lifespan_context["client"].fetch.return_value = {
-            "values": [
-                {"name": "hinv.ncpu", "instances": [{"value": 4}]},
-                {"name": "mem.physmem", "instances": [{"value": 16000000}]},
-            ]
+        mock_context.request_context.lifespan_context["client"].fetch_with_rates.return_value = {
+            **process_metrics_data(),
+            **system_info_data,
         }
         mock_context.report_progress = AsyncMock()
 
@@ -249,6 +516,90 @@ class TestGetProcessTop:
         calls = mock_context.report_progress.call_args_list
         assert calls[-1] == call(100, 100, "Complete")
 
+    async def test_samples_system_info_with_process_metrics(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        process_metrics_data,
+        system_info_data: dict,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = {**process_metrics_data(), **system_info_data}
+
+        await system_tools["get_process_top"](mock_context)
+
+        fetched_metrics = client.fetch_with_rates.call_args[0][0]
+        assert {"hinv.ncpu", "mem.physmem"} <= set(fetched_metrics)
+        client.fetch.assert_not_called()
+
+    async def test_reuses_recent_process_list(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        process_metrics_data,
+        system_info_data: dict,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = {**process_metrics_data(), **system_info_data}
+
+        first = await system_tools["get_process_top"](mock_context, sort_by="memory")
+        second = await system_tools["get_process_top"](mock_context, sort_by="memory")
+        await system_tools["get_process_top"](mock_context, sort_by="memory", limit=5)
+
+        assert client.fetch_with_rates.call_count == 2
+        assert second.structured_content == first.structured_content
+
+    async def test_reports_completion_on_cache_hit(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        process_metrics_data,
+        system_info_data: dict,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = {**process_metrics_data(), **system_info_data}
+
+        await system_tools["get_process_top"](mock_context)
+        mock_context.report_progress.reset_mock()
+        await system_tools["get_process_top"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 1
+        mock_context.report_progress.assert_awaited_once_with(100, 100, "Complete")
+
+    async def test_default_and_explicit_target_host_share_cache(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        process_metrics_data,
+        system_info_data: dict,
+    ) -> None:
+        lifespan_context = mock_context.request_context.lifespan_context
+        client = lifespan_context["client"]
+        client.fetch_with_rates.return_value = {**process_metrics_data(), **system_info_data}
+        target_host = lifespan_context["settings"].target_host
+
+        await system_tools["get_process_top"](mock_context)
+        await system_tools["get_process_top"](mock_context, host=target_host)
+
+        assert client.fetch_with_rates.call_count == 1
+
+    async def test_refetches_when_ttl_disabled(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        process_metrics_data,
+        system_info_data: dict,
+    ) -> None:
+        lifespan_context = mock_context.request_context.lifespan_context
+        lifespan_context["settings"].snapshot_ttl = 0.0
+        client = lifespan_context["client"]
+        client.fetch_with_rates.return_value = {**process_metrics_data(), **system_info_data}
+
+        await system_tools["get_process_top"](mock_context)
+        await system_tools["get_process_top"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 2
+
 
 class TestSmartDiagnose:
     async def test_returns_llm_diagnosis(
@@ -312,6 +663,97 @@ class TestSmartDiagnose:
         assert result.structured_content["hostname"] == "localhost"
         assert len(result.structured_content["recommendations"]) > 0
 
+    async def test_reuses_recent_broader_snapshot(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+        mock_context.sample = AsyncMock(side_effect=RuntimeError("LLM not available"))
+
+        await system_tools["get_system_snapshot"](mock_context)
+        result = await system_tools["smart_diagnose"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 1
+        assert result.structured_content["hostname"] == "localhost"
+
+    async def test_refetches_when_ttl_disabled(
+        self,
+        mock_context: MagicMock,
+        system_tools: dict,
+        full_system_snapshot_data,
+    ) -> None:
+        lifespan_context = mock_context.request_context.lifespan_context
+        lifespan_context["settings"].snapshot_ttl = 0.0
+        client = lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+        mock_context.sample = AsyncMock(side_effect=RuntimeError("LLM not available"))
+
+        await system_tools["smart_diagnose"](mock_context)
+        await system_tools["smart_diagnose"](mock_context)
+
+        assert client.fetch_with_rates.call_count == 2
+
+
+class TestFetchSystemSnapshotMaxAge:
+    async def test_projects_covering_snapshot(
+        self, mock_context: MagicMock, full_system_snapshot_data
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+        all_categories = ["cpu", "memory", "disk", "network", "load"]
+
+        full = await _fetch_system_snapshot(mock_context, all_categories, 1.0, None)
+        partial = await _fetch_system_snapshot(mock_context, ["cpu"], 0.5, None, max_age=5.0)
+
+        assert client.fetch_with_rates.call_count == 1
+        assert partial.cpu == full.cpu
+        assert partial.memory is None
+        assert partial.timestamp == full.timestamp
+
+    @pytest.mark.parametrize(
+        ("cached_categories", "max_age"),
+        [
+            (["cpu"], 5.0),
+            (["cpu", "memory"], None),
+        ],
+        ids=["not_covering", "no_max_age"],
+    )
+    async def test_samples_when_no_covering_snapshot(
+        self,
+        mock_context: MagicMock,
+        full_system_snapshot_data,
+        cached_categories: list[str],
+        max_age: float | None,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await _fetch_system_snapshot(mock_context, cached_categories, 1.0, None)
+        await _fetch_system_snapshot(mock_context, ["cpu", "memory"], 0.5, None, max_age=max_age)
+
+        assert client.fetch_with_rates.call_count == 2
+
+    async def test_samples_other_host(
+        self,
+        mock_context: MagicMock,
+        full_system_snapshot_data,
+        remote_client: AsyncMock,
+    ) -> None:
+        client = mock_context.request_context.lifespan_context["client"]
+        client.fetch_with_rates.return_value = full_system_snapshot_data()
+        remote_client.fetch_with_rates.return_value = full_system_snapshot_data()
+
+        await _fetch_system_snapshot(mock_context, ["cpu", "memory"], 1.0, None)
+        snapshot = await _fetch_system_snapshot(
+            mock_context, ["cpu", "memory"], 0.5, REMOTE_HOST, max_age=5.0
+        )
+
+        assert remote_client.fetch_with_rates.call_count == 1
+        assert snapshot.hostname == REMOTE_HOST
+
 
 class TestFormatSnapshotForLlm:
     def test_formats_all_sections(self, full_system_snapshot_data) -> None:
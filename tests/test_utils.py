@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+
 import pytest
+from pydantic import ValidationError
 
 from pcp_mcp.utils.builders import (
     assess_processes,
@@ -12,15 +15,17 @@ from pcp_mcp.utils.builders import (
     build_memory_metrics,
     build_network_metrics,
     build_process_list,
-    get_sort_key,
+    utc_now_iso,
 )
 from pcp_mcp.utils.extractors import (
     extract_help_text,
     extract_timestamp,
     format_units,
     get_first_value,
+    get_first_values,
     get_scalar_value,
     sum_instances,
+    sum_instances_each,
 )
 
 
@@ -39,6 +44,24 @@ class TestGetFirstValue:
         assert get_first_value(data, metric, default) == expected
 
 
+class TestGetFirstValues:
+    def test_matches_get_first_value_per_metric(self) -> None:
+        data = {
+            "a": {"instances": {-1: 1}},
+            "b": {"instances": {"x": 2.5, "y": 9.0}},
+            "c": {"instances": {}},
+            "d": {},
+        }
+        metrics = ("a", "b", "c", "d", "missing")
+
+        assert get_first_values(data, metrics, 3.0) == tuple(
+            get_first_value(data, metric, 3.0) for metric in metrics
+        )
+
+    def test_empty_metrics(self) -> None:
+        assert get_first_values({"a": {"instances": {-1: 1}}}, ()) == ()
+
+
 class TestGetScalarValue:
     @pytest.mark.parametrize(
         ("response", "metric", "default", "expected"),
@@ -80,6 +103,17 @@ class TestSumInstances:
     def test_sum(self, data: dict, metric: str, expected: float) -> None:
         assert sum_instances(data, metric) == expected
 
+    def test_returns_float(self) -> None:
+        result = sum_instances({"net.bytes": {"instances": {"eth0": 1, "lo": 2}}}, "net.bytes")
+        assert isinstance(result, float)
+
+    def test_sum_each(self) -> None:
+        data = {
+            "in": {"instances": {"eth0": 100, "lo": 50.5}},
+            "out": {"instances": {}},
+        }
+        assert sum_instances_each(data, ("in", "out", "missing")) == (150.5, 0.0, 0.0)
+
 
 class TestExtractHelpText:
     @pytest.mark.parametrize(
@@ -103,6 +137,7 @@ class TestExtractTimestamp:
             ({"timestamp": {"s": 1000, "us": 500000}}, 1000.5),
             ({"timestamp": {"s": 1000, "us": 0}}, 1000.0),
             ({"timestamp": 1234.567}, 1234.567),
+            ({"timestamp": 1234}, 1234.0),
             ({}, 0.0),
             ({"timestamp": {}}, 0.0),
         ],
@@ -151,6 +186,12 @@ class TestBuildCPUMetrics:
         result = build_cpu_metrics(data)
         assert expected_assessment.lower() in result.assessment.lower()
 
+    def test_assessment_uses_reported_values(self, cpu_metrics_data) -> None:
+        data = cpu_metrics_data(user=20.0, sys=10.0, idle=49.96, iowait=20.04)
+        result = build_cpu_metrics(data)
+        assert result.iowait_percent == 20.0
+        assert "normal" in result.assessment.lower()
+
     def test_zero_total_cpu(self, cpu_metrics_data) -> None:
         data = cpu_metrics_data(user=0.0, sys=0.0, idle=0.0, iowait=0.0)
         result = build_cpu_metrics(data)
@@ -165,6 +206,8 @@ class TestBuildMemoryMetrics:
             (16_000_000, 12_000_000, 8_000_000, 7_000_000, "normal"),
             (16_000_000, 1_000_000, 8_000_000, 7_000_000, "critical"),
             (16_000_000, 3_000_000, 8_000_000, 7_000_000, "elevated"),
+            (16_000_000, 4_000_000, 8_000_000, 7_000_000, "normal"),
+            (16_000_000, 1_600_000, 8_000_000, 7_000_000, "elevated"),
             (16_000_000, 10_000_000, 8_000_000, 2_000_000, "swap"),
         ],
     )
@@ -200,6 +243,8 @@ class TestBuildDiskMetrics:
             (1_000_000.0, 500_000.0, "low"),
             (15_000_000.0, 5_000_000.0, "moderate"),
             (150_000_000.0, 50_000_000.0, "heavy"),
+            (10_000_000.0, 10_000_000.0, "low"),
+            (5_000_000.0, 100_000_000.0, "moderate"),
         ],
     )
     def test_assessments(
@@ -217,6 +262,8 @@ class TestBuildNetworkMetrics:
             ({"eth0": 1_000_000.0}, {"eth0": 500_000.0}, "low"),
             ({"eth0": 10_000_000.0}, {"eth0": 5_000_000.0}, "moderate"),
             ({"eth0": 100_000_000.0}, {"eth0": 50_000_000.0}, "high"),
+            ({"eth0": 6_000_000.0}, {"eth0": 4_000_000.0}, "low"),
+            ({"eth0": 60_000_000.0}, {"eth0": 40_000_000.0}, "moderate"),
         ],
     )
     def test_assessments(
@@ -227,6 +274,34 @@ class TestBuildNetworkMetrics:
         assert expected_assessment.lower() in result.assessment.lower()
 
 
+class TestBuildersSkipValidation:
+    @pytest.mark.parametrize(
+        "builder",
+        [
+            build_cpu_metrics,
+            build_memory_metrics,
+            build_load_metrics,
+            build_disk_metrics,
+            build_network_metrics,
+        ],
+    )
+    @pytest.mark.parametrize("empty", [False, True])
+    def test_constructed_models_are_valid(self, full_system_snapshot_data, builder, empty) -> None:
+        result = builder({} if empty else full_system_snapshot_data())
+        assert type(result).model_validate(result.model_dump(), strict=True) == result
+
+    def test_constructed_models_are_frozen(self, full_system_snapshot_data) -> None:
+        result = build_cpu_metrics(full_system_snapshot_data())
+        with pytest.raises(ValidationError, match="frozen"):
+            result.assessment = "changed"
+
+    def test_constructed_processes_are_valid(self, process_metrics_data) -> None:
+        data = process_metrics_data()
+        for sort_by in ("cpu", "memory", "io"):
+            for proc in build_process_list(data, sort_by, total_mem=16_000_000_000, ncpu=4):
+                assert type(proc).model_validate(proc.model_dump(), strict=True) == proc
+
+
 class TestBuildProcessList:
     def test_builds_process_list(self, process_metrics_data) -> None:
         data = process_metrics_data()
@@ -246,6 +321,47 @@ class TestBuildProcessList:
         assert len(processes) == 1
         assert processes[0].pid == 1234
 
+    @pytest.mark.parametrize(
+        ("sort_by", "expected_pids"),
+        [
+            ("cpu", [30, 10]),
+            ("memory", [20, 30]),
+            ("io", [10, 20]),
+            ("unknown", [10, 20]),
+        ],
+    )
+    def test_limit_selects_top_processes(
+        self, process_metrics_data, sort_by: str, expected_pids: list[int]
+    ) -> None:
+        data = process_metrics_data(
+            processes=[
+                {
+                    "inst": 1,
+                    "pid": 10,
+                    "cmd": "a",
+                    "args": "",
+                    "rss": 100,
+                    "utime": 200.0,
+                    "io_read": 9000.0,
+                },
+                {
+                    "inst": 2,
+                    "pid": 20,
+                    "cmd": "b",
+                    "args": "",
+                    "rss": 900,
+                    "utime": 10.0,
+                    "io_read": 5000.0,
+                },
+                {"inst": 3, "pid": 30, "cmd": "c", "args": "", "rss": 500, "utime": 400.0},
+                {"inst": 4, "pid": 0, "cmd": "gone", "args": "", "rss": 9999, "utime": 999.0},
+            ]
+        )
+        processes = build_process_list(
+            data, sort_by=sort_by, total_mem=16_000_000_000, ncpu=4, limit=2
+        )
+        assert [p.pid for p in processes] == expected_pids
+
     def test_memory_sort_omits_cpu_and_io_when_data_missing(self) -> None:
         data = {
             "proc.psinfo.pid": {"instances": {1: 1234}},
@@ -265,34 +381,33 @@ class TestBuildProcessList:
         assert processes[0].io_read_bytes_per_sec is None
         assert processes[0].io_write_bytes_per_sec is None
 
+    def test_zero_total_memory(self, process_metrics_data) -> None:
+        processes = build_process_list(
+            process_metrics_data(), sort_by="memory", total_mem=0, ncpu=4
+        )
+        assert processes
+        assert all(proc.rss_percent == 0.0 for proc in processes)
 
-class TestGetSortKey:
-    def test_cpu_sort(self, process_metrics_data) -> None:
-        data = process_metrics_data()
-        processes = build_process_list(data, sort_by="cpu", total_mem=16_000_000_000, ncpu=4)
-        key = get_sort_key(processes[0], "cpu")
-        assert key == processes[0].cpu_percent
-
-    def test_memory_sort(self, process_metrics_data) -> None:
-        data = process_metrics_data()
-        processes = build_process_list(data, sort_by="memory", total_mem=16_000_000_000, ncpu=4)
-        key = get_sort_key(processes[0], "memory")
-        assert key == float(processes[0].rss_bytes)
-
-    def test_io_sort(self, process_metrics_data) -> None:
-        data = process_metrics_data()
-        processes = build_process_list(data, sort_by="io", total_mem=16_000_000_000, ncpu=4)
-        key = get_sort_key(processes[0], "io")
-        expected = (processes[0].io_read_bytes_per_sec or 0) + (
-            processes[0].io_write_bytes_per_sec or 0
+    @pytest.mark.parametrize(
+        ("sort_by", "has_cpu", "has_io"),
+        [
+            ("cpu", True, False),
+            ("memory", False, False),
+            ("io", False, True),
+        ],
+    )
+    def test_only_sort_metric_is_computed(
+        self, process_metrics_data, sort_by: str, has_cpu: bool, has_io: bool
+    ) -> None:
+        processes = build_process_list(
+            process_metrics_data(), sort_by=sort_by, total_mem=16_000_000_000, ncpu=4
         )
-        assert key == expected
 
-    def test_unknown_sort(self, process_metrics_data) -> None:
-        data = process_metrics_data()
-        processes = build_process_list(data, sort_by="cpu", total_mem=16_000_000_000, ncpu=4)
-        key = get_sort_key(processes[0], "unknown")
-        assert key == 0.0
+        assert processes
+        for proc in processes:
+            assert (proc.cpu_percent is not None) is has_cpu
+            assert (proc.io_read_bytes_per_sec is not None) is has_io
+            assert (proc.io_write_bytes_per_sec is not None) is has_io
 
 
 class TestAssessProcesses:
@@ -327,3 +442,9 @@ class TestAssessProcesses:
         procs = build_process_list(data, sort_by="cpu", total_mem=16_000_000_000, ncpu=4)
         assessment = assess_processes(procs, "unknown", 4)
         assert "Top process" in assessment
+
+
+class TestUtcNowIso:
+    def test_is_timezone_aware_iso_format(self) -> None:
+        parsed = datetime.fromisoformat(utc_now_iso())
+        assert parsed.utcoffset() == timedelta(0)